@@ -0,0 +1,153 @@
+"""
+Breadth-first traversal kernels for the CSR adjacency index.
+
+bfs_reachable uses a Numba-compiled kernel when numba is installed
+(``pip install springmvc-agent-analyzer[speedups]``) and a pure-Python
+loop otherwise; both return reachable nodes in the same BFS order.
+bfs_shortest_path stops at the first hit, so it stays in Python.
+"""
+
+from array import array
+from typing import List, Optional
+
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
+    np = None
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _bfs_kernel(indptr, indices, start, max_depth):
+        """Compiled BFS; max_depth < 0 means unlimited."""
+        n = indptr.shape[0] - 1
+        visited = np.zeros(n, dtype=np.uint8)
+        order = np.empty(n, dtype=np.int64)
+        visited[start] = 1
+        order[0] = start
+        head = 0
+        tail = 1
+        level_end = 1
+        depth = 0
+
+        while head < tail and (max_depth < 0 or depth < max_depth):
+            while head < level_end:
+                u = order[head]
+                head += 1
+                for k in range(indptr[u], indptr[u + 1]):
+                    v = indices[k]
+                    if visited[v] == 0:
+                        visited[v] = 1
+                        order[tail] = v
+                        tail += 1
+            level_end = tail
+            depth += 1
+
+        return order[1:tail]
+
+
+def _as_ndarray(values: array):
+    """Zero-copy numpy view of a stdlib int array."""
+    return np.frombuffer(values, dtype=f"i{values.itemsize}")
+
+
+def bfs_reachable(
+    indptr: array,
+    indices: array,
+    start: int,
+    max_depth: Optional[int] = None
+) -> List[int]:
+    """
+    Level-synchronous BFS over CSR arrays, excluding start itself.
+
+    Args:
+        indptr: CSR row pointers (len = node count + 1)
+        indices: CSR neighbor indices
+        start: Int index of the root node
+        max_depth: Maximum depth to traverse (None for unlimited)
+
+    Returns:
+        Int indices of reachable nodes in BFS order
+
+    Raises:
+        ValueError: If max_depth is negative
+    """
+    if max_depth is not None and max_depth < 0:
+        raise ValueError(f"max_depth must be non-negative, got {max_depth}")
+
+    if numba is not None:
+        # The kernel takes -1 as its unlimited sentinel
+        found = _bfs_kernel(
+            _as_ndarray(indptr),
+            _as_ndarray(indices),
+            start,
+            -1 if max_depth is None else max_depth
+        )
+        return found.tolist()
+
+    visited = bytearray(len(indptr) - 1)
+    visited[start] = 1
+    frontier = [start]
+    found: List[int] = []
+    depth = 0
+
+    while frontier and (max_depth is None or depth < max_depth):
+        next_frontier = []
+        for u in frontier:
+            for v in indices[indptr[u]:indptr[u + 1]]:
+                if not visited[v]:
+                    visited[v] = 1
+                    next_frontier.append(v)
+        found.extend(next_frontier)
+        frontier = next_frontier
+        depth += 1
+
+    return found
+
+
+def bfs_shortest_path(
+    indptr: array,
+    indices: array,
+    start: int,
+    goal: int
+) -> Optional[List[int]]:
+    """
+    Unweighted shortest path over CSR arrays, stopping at the first hit.
+
+    Args:
+        indptr: CSR row pointers (len = node count + 1)
+        indices: CSR neighbor indices
+        start: Int index of the source node
+        goal: Int index of the target node
+
+    Returns:
+        Int indices from start to goal inclusive, or None if goal is unreachable
+    """
+    if start == goal:
+        return [start]
+
+    # Sized to the explored region rather than the whole graph, so short
+    # paths in large graphs don't pay for an O(V) allocation
+    parent = {start: start}
+    frontier = [start]
+
+    while frontier:
+        next_frontier = []
+        for u in frontier:
+            for v in indices[indptr[u]:indptr[u + 1]]:
+                if v in parent:
+                    continue
+                parent[v] = u
+                if v == goal:
+                    path = [v]
+                    while v != start:
+                        v = parent[v]
+                        path.append(v)
+                    path.reverse()
+                    return path
+                next_frontier.append(v)
+        frontier = next_frontier
+
+    return None
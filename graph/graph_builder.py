@@ -5,14 +5,190 @@ This module builds a NetworkX directed graph connecting all analyzed components
 (Controllers, JSPs, Services, Mappers, Procedures) with their relationships.
 """
 
-from typing import Dict, Any, List, Optional, Set, Tuple
+from typing import Dict, Any, FrozenSet, List, Optional, Set, Tuple
 from pathlib import Path
+from array import array
+from collections import Counter
+import functools
 import logging
 import networkx as nx
 import json
 import itertools
+import re
 
 from graph.schema import Node, Edge, NodeType, EdgeType, GraphSchema
+from graph._bfs import bfs_reachable, bfs_shortest_path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Types that are never treated as custom models (see GraphBuilder._is_custom_model)
+_PRIMITIVE_TYPES = frozenset({
+    "int", "long", "double", "float", "boolean", "char", "byte", "short", "void"
+})
+_WRAPPER_TYPES = frozenset({
+    "String", "Integer", "Long", "Double", "Float", "Boolean", "Character", "Byte", "Short"
+})
+# Java standard library, Spring framework and collection types
+_NON_MODEL_PREFIX_RE = re.compile(r"java\.|javax\.|org\.springframework\.|List|Map|Set")
+
+# Compact NodeType encoding for the column-wise node data in _AdjacencyIndex
+_NODE_TYPE_CODES = {node_type: code for code, node_type in enumerate(NodeType)}
+_UNTRACKED_TYPE_CODE = 255
+
+# Unlimited-depth closures memoized per traversal snapshot
+_CLOSURE_CACHE_SIZE = 1024
+
+# Type-name classifications memoized process-wide, shared by every builder
+_TYPE_CACHE_SIZE = 4096
+
+
+def _write_json(path: Path, data: Any):
+    """Write data to path as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+
+class _AdjacencyIndex:
+    """
+    Compact CSR snapshot of a graph's adjacency for traversal queries.
+
+    Node IDs are interned to consecutive ints and forward/reverse neighbors
+    are stored as flat int arrays (indptr/indices), so a BFS hop is a slice
+    of a contiguous array instead of a walk over NetworkX's nested dicts.
+    Parallel edges collapse to a single neighbor entry.
+
+    Per-node data is kept column-wise alongside the IDs, so traversal
+    results are resolved with one list gather and type tallies run over a
+    flat byte array instead of touching every Node object.
+
+    Attributes:
+        graph: Graph the snapshot was built from
+        ids: Node IDs by int index
+        index: Node ID to int index
+        records: Node objects by int index (None for untracked graph nodes)
+        types: NodeType codes by int index (see _NODE_TYPE_CODES)
+        out_ptr, out_idx: CSR arrays for successors
+        in_ptr, in_idx: CSR arrays for predecessors
+        closures: Memoized unlimited-depth closures by (start, reverse)
+    """
+
+    __slots__ = (
+        "graph", "ids", "index", "records", "types",
+        "out_ptr", "out_idx", "in_ptr", "in_idx", "closures",
+    )
+
+    def __init__(self, graph: nx.MultiDiGraph, nodes: Dict[str, Node]):
+        self.graph = graph
+        self.ids = list(graph.nodes())
+        self.index = {node_id: i for i, node_id in enumerate(self.ids)}
+        self.records = [nodes.get(node_id) for node_id in self.ids]
+        self.types = array("B", (
+            _UNTRACKED_TYPE_CODE if node is None else _NODE_TYPE_CODES[node.type]
+            for node in self.records
+        ))
+        self.out_ptr, self.out_idx = self._compress(graph.succ)
+        self.in_ptr, self.in_idx = self._compress(graph.pred)
+        self.closures: Dict[Tuple[int, bool], FrozenSet[Node]] = {}
+
+    def _compress(self, adjacency) -> Tuple[array, array]:
+        """Flatten an adjacency mapping into (indptr, indices) arrays."""
+        index = self.index
+        indptr = array("l", [0])
+        indices = array("l")
+        for node_id in self.ids:
+            indices.extend(index[neighbor] for neighbor in adjacency[node_id])
+            indptr.append(len(indices))
+        return indptr, indices
+
+    def reachable(
+        self,
+        start: int,
+        max_depth: Optional[int] = None,
+        reverse: bool = False
+    ) -> List[int]:
+        """
+        Level-synchronous BFS from start, excluding start itself.
+
+        Args:
+            start: Int index of the root node
+            max_depth: Maximum depth to traverse (None for unlimited)
+            reverse: Follow incoming instead of outgoing edges
+
+        Returns:
+            Int indices of reachable nodes in BFS order
+        """
+        if reverse:
+            return bfs_reachable(self.in_ptr, self.in_idx, start, max_depth)
+        return bfs_reachable(self.out_ptr, self.out_idx, start, max_depth)
+
+    def direct(self, start: int) -> Tuple[List[int], List[int]]:
+        """Direct successors and predecessors of start, read off the CSR rows."""
+        direct_out = self.out_idx[self.out_ptr[start]:self.out_ptr[start + 1]].tolist()
+        direct_in = self.in_idx[self.in_ptr[start]:self.in_ptr[start + 1]].tolist()
+        return direct_out, direct_in
+
+    def transitive(
+        self,
+        start: int,
+        max_depth: Optional[int] = None,
+        reverse: bool = False
+    ) -> Set[Node]:
+        """
+        Tracked nodes reachable from start, excluding start itself.
+
+        Unlimited-depth closures are memoized for the lifetime of the
+        snapshot (it is discarded whenever the graph changes), so repeated
+        queries from the same root skip the BFS. Depth-limited queries
+        always traverse.
+
+        Args:
+            start: Int index of the root node
+            max_depth: Maximum depth to traverse (None for unlimited)
+            reverse: Follow incoming instead of outgoing edges
+
+        Returns:
+            New set of reachable Node objects
+        """
+        if max_depth is not None:
+            return self.gather(self.reachable(start, max_depth, reverse))
+
+        key = (start, reverse)
+        closure = self.closures.get(key)
+        if closure is None:
+            if len(self.closures) >= _CLOSURE_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self.closures[next(iter(self.closures))]
+            closure = frozenset(self.gather(self.reachable(start, None, reverse)))
+            self.closures[key] = closure
+        return set(closure)
+
+    def shortest_path(self, start: int, goal: int) -> Optional[List[int]]:
+        """Int indices of an unweighted shortest path along outgoing edges."""
+        return bfs_shortest_path(self.out_ptr, self.out_idx, start, goal)
+
+    def gather(self, found: List[int]) -> Set[Node]:
+        """Resolve int indices to their tracked Node objects."""
+        records = self.records
+        return {records[i] for i in found if records[i] is not None}
+
+    def gather_list(self, found: List[int]) -> List[Node]:
+        """Resolve int indices to their tracked Node objects, keeping order."""
+        records = self.records
+        return [records[i] for i in found if records[i] is not None]
+
+    def count_types(self) -> Dict[str, int]:
+        """Count tracked nodes per NodeType value."""
+        types = self.types
+        return {node_type.value: types.count(code) for node_type, code in _NODE_TYPE_CODES.items()}
 
 
 class GraphBuilder:
@@ -38,8 +214,21 @@ class GraphBuilder:
         self.schema = GraphSchema()
         self.logger = logging.getLogger("graph.graph_builder")
 
+        # Traversal index, rebuilt lazily after the graph changes
+        self._adjacency: Optional[_AdjacencyIndex] = None
+
+        # (source, target, type) of every edge, for exact O(1) duplicate checks
+        # in add_edge instead of scanning parallel edges in the MultiDiGraph
+        self._edge_keys: Set[Tuple[str, str, str]] = set()
+
         self.logger.info("GraphBuilder initialized")
 
+    def _get_adjacency(self) -> _AdjacencyIndex:
+        """Return the CSR traversal index, rebuilding it if the graph changed."""
+        if self._adjacency is None or self._adjacency.graph is not self.graph:
+            self._adjacency = _AdjacencyIndex(self.graph, self.nodes)
+        return self._adjacency
+
     def add_node(self, node: Node) -> bool:
         """
         Add a node to the graph.
@@ -55,19 +244,22 @@ class GraphBuilder:
             return False
 
         self.nodes[node.id] = node
+        type_value = node.type.value
         self.graph.add_node(
             node.id,
-            type=node.type.value,
+            type=type_value,
             name=node.name,
             file_path=node.file_path,
             **node.metadata
         )
 
+        self._adjacency = None
+
         # Update file index if file_path is provided
         if node.file_path:
             self.file_index[node.file_path] = node.id
 
-        self.logger.debug(f"Added node: {node.id} (type={node.type.value})")
+        self.logger.debug("Added node: %s (type=%s)", node.id, type_value)
         return True
 
     def add_edge(self, edge: Edge) -> bool:
@@ -92,35 +284,33 @@ class GraphBuilder:
         # Validate edge pattern
         source_type = self.nodes[edge.source].type
         target_type = self.nodes[edge.target].type
+        type_value = edge.type.value
 
         if not self.schema.validate_edge(source_type, edge.type, target_type):
             self.logger.warning(
-                f"Invalid edge pattern: {source_type.value} --{edge.type.value}--> {target_type.value}"
+                f"Invalid edge pattern: {source_type.value} --{type_value}--> {target_type.value}"
             )
             return False
 
         # Check if edge with same source, target, AND type already exists
-        # In MultiDiGraph, graph[source][target] returns dict of {edge_key: edge_data}
-        if self.graph.has_edge(edge.source, edge.target):
-            edges_between = self.graph[edge.source][edge.target]
-            for edge_key, edge_data in edges_between.items():
-                if edge_data.get("type") == edge.type.value:
-                    self.logger.debug(
-                        f"Edge already exists: {edge.source} --{edge.type.value}--> {edge.target}"
-                    )
-                    return False
+        edge_key = (edge.source, edge.target, type_value)
+        if edge_key in self._edge_keys:
+            self.logger.debug(
+                "Edge already exists: %s --%s--> %s", edge.source, type_value, edge.target
+            )
+            return False
 
         # Add edge
         self.graph.add_edge(
             edge.source,
             edge.target,
-            type=edge.type.value,
+            type=type_value,
             **edge.metadata
         )
+        self._edge_keys.add(edge_key)
+        self._adjacency = None
 
-        self.logger.debug(
-            f"Added edge: {edge.source} --{edge.type.value}--> {edge.target}"
-        )
+        self.logger.debug("Added edge: %s --%s--> %s", edge.source, type_value, edge.target)
         return True
 
     def build_from_analysis_results(
@@ -757,10 +947,15 @@ class GraphBuilder:
 
         return edges_added
 
-    def _is_custom_model(self, type_name: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=_TYPE_CACHE_SIZE)
+    def _is_custom_model(type_name: str) -> bool:
         """
         Check if a type is a custom model/DTO (not primitive or framework class).
 
+        Memoized: a project only references a bounded set of type names, and
+        the same ones are classified for every controller and service.
+
         Args:
             type_name: Fully qualified or simple type name
 
@@ -770,30 +965,11 @@ class GraphBuilder:
         if not type_name:
             return False
 
-        # Exclude primitives
-        primitives = {"int", "long", "double", "float", "boolean", "char", "byte", "short", "void"}
-        if type_name.lower() in primitives:
-            return False
-
-        # Exclude Java standard library
-        if type_name.startswith("java.") or type_name.startswith("javax."):
-            return False
-
-        # Exclude Spring framework
-        if type_name.startswith("org.springframework."):
-            return False
-
-        # Exclude common wrappers
-        wrappers = {"String", "Integer", "Long", "Double", "Float", "Boolean", "Character", "Byte", "Short"}
-        if type_name in wrappers:
-            return False
-
-        # Exclude collections
-        if type_name.startswith("List") or type_name.startswith("Map") or type_name.startswith("Set"):
-            return False
-
-        # Likely a custom model
-        return True
+        return (
+            type_name.lower() not in _PRIMITIVE_TYPES
+            and type_name not in _WRAPPER_TYPES
+            and not _NON_MODEL_PREFIX_RE.match(type_name)
+        )
 
     def _extract_mapper_edges(
         self,
@@ -1037,12 +1213,13 @@ class GraphBuilder:
         if source_id not in self.graph or target_id not in self.graph:
             return None
 
-        try:
-            path = nx.shortest_path(self.graph, source_id, target_id)
-            return [self.nodes[nid] for nid in path if nid in self.nodes]
-        except nx.NetworkXNoPath:
+        adjacency = self._get_adjacency()
+        path = adjacency.shortest_path(adjacency.index[source_id], adjacency.index[target_id])
+        if path is None:
             return None
 
+        return adjacency.gather_list(path)
+
     def find_all_dependencies(
         self,
         node_id: str,
@@ -1067,33 +1244,8 @@ class GraphBuilder:
         if node_id not in self.graph:
             return set()
 
-        dependencies = set()
-        visited = set()
-        queue = [(node_id, 0)]
-
-        while queue:
-            current_id, depth = queue.pop(0)
-
-            if current_id in visited:
-                continue
-
-            visited.add(current_id)
-
-            # Skip root node
-            if current_id != node_id:
-                if current_id in self.nodes:
-                    dependencies.add(self.nodes[current_id])
-
-            # Check depth limit
-            if max_depth is not None and depth >= max_depth:
-                continue
-
-            # Add successors
-            for successor in self.graph.successors(current_id):
-                if successor not in visited:
-                    queue.append((successor, depth + 1))
-
-        return dependencies
+        adjacency = self._get_adjacency()
+        return adjacency.transitive(adjacency.index[node_id], max_depth, reverse=False)
 
     def find_all_dependents(
         self,
@@ -1119,33 +1271,8 @@ class GraphBuilder:
         if node_id not in self.graph:
             return set()
 
-        dependents = set()
-        visited = set()
-        queue = [(node_id, 0)]
-
-        while queue:
-            current_id, depth = queue.pop(0)
-
-            if current_id in visited:
-                continue
-
-            visited.add(current_id)
-
-            # Skip root node
-            if current_id != node_id:
-                if current_id in self.nodes:
-                    dependents.add(self.nodes[current_id])
-
-            # Check depth limit
-            if max_depth is not None and depth >= max_depth:
-                continue
-
-            # Add predecessors
-            for predecessor in self.graph.predecessors(current_id):
-                if predecessor not in visited:
-                    queue.append((predecessor, depth + 1))
-
-        return dependents
+        adjacency = self._get_adjacency()
+        return adjacency.transitive(adjacency.index[node_id], max_depth, reverse=True)
 
     def analyze_impact(
         self,
@@ -1171,15 +1298,26 @@ class GraphBuilder:
                 "all_dependents": Set[Node],
                 "impact_score": float  # Total affected nodes
             }
+
+        Raises:
+            ValueError: If max_depth is negative
         """
+        if max_depth is not None and max_depth < 0:
+            raise ValueError(f"max_depth must be non-negative, got {max_depth}")
+
         if node_id not in self.nodes:
             return {}
 
         node = self.nodes[node_id]
-        direct_deps = self.get_neighbors(node_id, direction="outgoing")
-        all_deps = self.find_all_dependencies(node_id, max_depth)
-        direct_dependents = self.get_neighbors(node_id, direction="incoming")
-        all_dependents = self.find_all_dependents(node_id, max_depth)
+
+        # One index snapshot serves all four results
+        adjacency = self._get_adjacency()
+        start = adjacency.index[node_id]
+        direct_out, direct_in = adjacency.direct(start)
+        direct_deps = adjacency.gather_list(direct_out)
+        all_deps = adjacency.transitive(start, max_depth, reverse=False)
+        direct_dependents = adjacency.gather_list(direct_in)
+        all_dependents = adjacency.transitive(start, max_depth, reverse=True)
 
         return {
             "node": node,
@@ -1277,18 +1415,13 @@ class GraphBuilder:
         Returns:
             Dictionary with node counts, edge counts, connectivity metrics, etc.
         """
-        node_counts = {}
-        for node_type in NodeType:
-            node_counts[node_type.value] = sum(
-                1 for n in self.nodes.values() if n.type == node_type
-            )
+        node_counts = self._get_adjacency().count_types()
 
-        edge_counts = {}
-        for edge_type in EdgeType:
-            edge_counts[edge_type.value] = sum(
-                1 for _, _, data in self.graph.edges(data=True)
-                if data.get("type") == edge_type.value
-            )
+        # One pass over the edges instead of one per EdgeType
+        edge_type_tally = Counter(edge_type for _, _, edge_type in self.graph.edges(data="type"))
+        edge_counts = {
+            edge_type.value: edge_type_tally[edge_type.value] for edge_type in EdgeType
+        }
 
         # Find orphan nodes (nodes with no edges)
         orphan_nodes = [
@@ -1362,8 +1495,7 @@ class GraphBuilder:
         elif format == "json":
             # Save as node-link JSON format
             data = nx.node_link_data(self.graph)
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            _write_json(path, data)
             self.logger.info(f"Graph saved to {path} (JSON format)")
 
         elif format == "pickle":
@@ -1531,8 +1663,7 @@ class GraphBuilder:
             }
         }
 
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        _write_json(path, data)
 
     def export_cytoscape_json(self, output_path: str):
         """
@@ -1584,17 +1715,18 @@ class GraphBuilder:
             "metadata": self.get_stats()
         }
 
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        _write_json(path, data)
 
     def _rebuild_indices(self):
         """
-        Rebuild nodes dictionary and file_index from loaded graph.
+        Rebuild nodes dictionary, file_index and edge keys from loaded graph.
 
         Called after loading a graph from disk to reconstruct in-memory structures.
         """
         self.nodes.clear()
         self.file_index.clear()
+        self._adjacency = None
+        self._edge_keys = set(self.graph.edges(data="type"))
 
         for node_id in self.graph.nodes():
             node_data = self.graph.nodes[node_id]
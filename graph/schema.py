@@ -6,7 +6,7 @@ dependency graph connecting Controllers, JSPs, Services, Mappers, and Procedures
 """
 
 from enum import Enum
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 
 
@@ -53,11 +53,15 @@ class EdgeType(Enum):
     TRANSFORMS = "transforms"              # Component → Model
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Node:
     """
     Represents a node in the knowledge graph.
 
+    Instances are immutable and slotted (no per-instance __dict__). The
+    metadata dict itself is not copied or frozen; treat it as read-only
+    once the node is added to a graph.
+
     Attributes:
         id: Unique identifier (e.g., "com.example.UserController", "users.jsp")
         type: Node type (controller, jsp, service, etc.)
@@ -80,11 +84,13 @@ class Node:
         return self.id == other.id
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Edge:
     """
     Represents a directed edge in the knowledge graph.
 
+    Immutable and slotted like Node; metadata is likewise read-only by contract.
+
     Attributes:
         source: Source node ID
         target: Target node ID
@@ -107,6 +113,32 @@ class Edge:
                 self.type == other.type)
 
 
+# One bit per NodeType, keyed by the enum value string. Enum.__hash__ is
+# implemented in Python, so schema lookups (here and in
+# GraphSchema._VALID_KEYS) key on the member's plain-str value instead of
+# the member itself.
+_NODE_TYPE_BITS = {node_type._value_: 1 << i for i, node_type in enumerate(NodeType)}
+
+
+def _build_target_masks(
+    patterns: Set[Tuple[NodeType, EdgeType, NodeType]]
+) -> Dict[Tuple[str, str], int]:
+    """
+    Fold edge patterns into a target-type bitmask per (source, edge) pair.
+
+    Args:
+        patterns: Valid (source_type, edge_type, target_type) triples
+
+    Returns:
+        Mapping of (source value, edge value) to a bitmask of allowed targets
+    """
+    masks: Dict[Tuple[str, str], int] = {}
+    for source, edge_type, target in patterns:
+        key = (source._value_, edge_type._value_)
+        masks[key] = masks.get(key, 0) | _NODE_TYPE_BITS[target._value_]
+    return masks
+
+
 class GraphSchema:
     """
     Schema definition and validation for knowledge graph.
@@ -148,6 +180,37 @@ class GraphSchema:
         (NodeType.JSP, EdgeType.CONSUMES, NodeType.MODEL),
     }
 
+    # Precomputed from VALID_PATTERNS, keyed by enum value strings
+    _VALID_KEYS = frozenset(
+        (source._value_, edge_type._value_, target._value_)
+        for source, edge_type, target in VALID_PATTERNS
+    )
+    _TARGET_MASKS = _build_target_masks(VALID_PATTERNS)
+
+    def __init__(self):
+        """
+        Bind a validate_edge specialized to this schema's fixed rule set.
+
+        The instance-level function closes over the frozen key set, so the
+        per-edge check in GraphBuilder.add_edge skips the classmethod
+        binding and class attribute lookups.
+        """
+        valid_keys = self._VALID_KEYS
+
+        def validate_edge(
+            source_type: NodeType,
+            edge_type: EdgeType,
+            target_type: NodeType
+        ) -> bool:
+            try:
+                return (source_type._value_, edge_type._value_, target_type._value_) in valid_keys
+            except AttributeError:
+                # Non-enum input (raw string, None) is never a valid pattern
+                return False
+
+        validate_edge.__doc__ = GraphSchema.validate_edge.__doc__
+        self.validate_edge = validate_edge
+
     @classmethod
     def validate_edge(
         cls,
@@ -166,7 +229,11 @@ class GraphSchema:
         Returns:
             True if pattern is valid, False otherwise
         """
-        return (source_type, edge_type, target_type) in cls.VALID_PATTERNS
+        try:
+            return (source_type._value_, edge_type._value_, target_type._value_) in cls._VALID_KEYS
+        except AttributeError:
+            # Non-enum input (raw string, None) is never a valid pattern
+            return False
 
     @classmethod
     def get_allowed_edges(cls, node_type: NodeType) -> List[EdgeType]:
@@ -200,7 +267,11 @@ class GraphSchema:
         Returns:
             List of allowed target node types
         """
+        try:
+            mask = cls._TARGET_MASKS.get((source_type._value_, edge_type._value_), 0)
+        except AttributeError:
+            return []
         return [
-            target for source, edge, target in cls.VALID_PATTERNS
-            if source == source_type and edge == edge_type
+            target for target in NodeType
+            if mask & _NODE_TYPE_BITS[target._value_]
         ]
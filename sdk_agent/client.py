@@ -46,20 +46,26 @@ class SpringMVCAnalyzerAgent:
         system_prompt: Optional[str] = None,
         hooks_enabled: Optional[bool] = None,
         permission_mode: Optional[str] = None,
-        max_turns: Optional[int] = None
+        max_turns: Optional[int] = None,
+        config: Optional[SDKAgentConfig] = None
     ):
         """
         Initialize SpringMVCAnalyzerAgent.
 
         Args:
-            config_path: Path to configuration file
+            config_path: Path to configuration file (ignored if config is given)
             system_prompt: Custom system prompt (overrides config)
             hooks_enabled: Enable hooks system (overrides config if specified)
             permission_mode: Permission mode (overrides config if specified)
             max_turns: Maximum conversation turns (overrides config if specified)
+            config: Already-loaded configuration, to skip re-reading the file.
+                The agent works on a copy, so overrides don't leak back.
         """
         # Load configuration
-        self.config = load_config(config_path)
+        if config is not None:
+            self.config = config.model_copy()
+        else:
+            self.config = load_config(config_path)
 
         # Override config with explicitly provided parameters
         if hooks_enabled is not None:
@@ -145,7 +145,13 @@ class ErrorFormatter:
                                max_context_value_length=1000,
                                max_total_context_length=5000)
         """
-        lines = [f"[{error_type}] {component}: {details}"]
+        headline = f"[{error_type}] {component}: {details}"
+
+        # Fast path: most errors carry no context or suggestions
+        if not context and not suggestions:
+            return headline
+
+        lines = [headline]
 
         if context:
             # Truncate context to prevent log spam (unless disabled with -1)
@@ -163,13 +169,11 @@ class ErrorFormatter:
                 )
 
             lines.append("\nContext:")
-            for key, value in truncated_context.items():
-                lines.append(f"  - {key}: {value}")
+            lines.extend([f"  - {key}: {value}" for key, value in truncated_context.items()])
 
         if suggestions:
             lines.append("\nSuggestions:")
-            for suggestion in suggestions:
-                lines.append(f"  - {suggestion}")
+            lines.extend([f"  - {suggestion}" for suggestion in suggestions])
 
         return "\n".join(lines)
 
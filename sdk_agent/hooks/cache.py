@@ -1,14 +1,54 @@
 """Cache Hook for SDK Agent Mode - Caches analysis results."""
 
 from typing import Dict, Any, Optional
+import hashlib
 import logging
 import json
+import math
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger("sdk_agent.hooks.cache")
 
 
+def _dumps(data: Any, sort_keys: bool = False, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+
+    # Match orjson byte for byte: raw UTF-8 and null for NaN/Infinity, so
+    # cache keys don't depend on whether the speedups extra is installed
+    data = _finite(data)
+    if indent:
+        return json.dumps(
+            data, sort_keys=sort_keys, indent=2, ensure_ascii=False
+        ).encode("utf-8")
+    return json.dumps(
+        data, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def _finite(data: Any) -> Any:
+    """Replace non-finite floats with None, as orjson serializes them."""
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {key: _finite(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_finite(value) for value in data]
+    return data
+
+
 class CacheHook:
     """Post-tool hook for caching analysis results."""
 
@@ -38,20 +78,37 @@ class CacheHook:
 
         return {}
 
+    def _generate_cache_key(self, tool_name: str, tool_input: Dict[str, Any]) -> str:
+        """
+        Generate a stable cache key for a tool invocation.
+
+        Args:
+            tool_name: Name of the tool
+            tool_input: Tool input parameters
+
+        Returns:
+            Cache key (16-char hex string)
+        """
+        payload = tool_name.encode("utf-8") + b":" + _dumps(tool_input, sort_keys=True)
+        return hashlib.sha256(payload).hexdigest()[:16]
+
     def _cache_analysis_result(self, tool_name: str, tool_input: Dict[str, Any], tool_output: Dict[str, Any]):
         """Cache analysis result to disk."""
         file_path = tool_input.get("file_path")
         if not file_path:
             return
 
+        # One file per tool and source file; the key identifies which input
+        # produced the stored result
         cache_file = self.cache_dir / f"{tool_name}_{Path(file_path).name}.json"
         cache_data = {
             "timestamp": datetime.now().isoformat(),
             "tool_name": tool_name,
+            "cache_key": self._generate_cache_key(tool_name, tool_input),
             "input": tool_input,
             "output": tool_output
         }
-        cache_file.write_text(json.dumps(cache_data, indent=2))
+        cache_file.write_bytes(_dumps(cache_data, indent=True))
         logger.debug(f"Cached result: {cache_file}")
 
 
@@ -2,6 +2,8 @@
 
 from typing import Dict, Any, Optional
 import logging
+import os
+import re
 from pathlib import Path
 
 logger = logging.getLogger("sdk_agent.hooks.input")
@@ -10,10 +12,20 @@ logger = logging.getLogger("sdk_agent.hooks.input")
 class InputEnhancementHook:
     """UserPromptSubmit hook to enhance user inputs."""
 
+    # "~/" at the start of the input or of a whitespace-separated word
+    _HOME_PATH_RE = re.compile(r"(?<!\S)~/")
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
         self.enabled = self.config.get("enabled", True)
         self.project_root = self.config.get("project_root")
+        self.expand_paths = self.config.get("expand_paths", True)
+
+        # Resolve the home directory once instead of on every prompt
+        try:
+            self._home_prefix = str(Path.home()) + os.sep
+        except RuntimeError:
+            self._home_prefix = None
         logger.info(f"InputEnhancementHook initialized")
 
     async def __call__(
@@ -31,14 +43,17 @@ class InputEnhancementHook:
         if self.project_root and Path(self.project_root).exists():
             enhancements.append(f"Project root: {self.project_root}")
 
-        # Expand relative paths mentioned in input
+        # Expand home-relative paths mentioned in input
         enhanced_input = user_input
+        if self.expand_paths and self._home_prefix and "~/" in user_input:
+            enhanced_input = self._HOME_PATH_RE.sub(lambda _: self._home_prefix, user_input)
+
         if enhancements:
-            enhanced_input = "\n".join(enhancements) + "\n\n" + user_input
+            enhanced_input = "\n".join(enhancements) + "\n\n" + enhanced_input
 
-        return {
-            "enhanced_input": enhanced_input if enhancements else None
-        }
+        if enhanced_input == user_input:
+            return {}
+        return {"enhanced_input": enhanced_input}
 
 
 default_input_hook = InputEnhancementHook()
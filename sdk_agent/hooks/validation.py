@@ -18,6 +18,7 @@ Note: Hook decorators will be added in Phase 5 when SDK is integrated.
 
 from typing import Dict, Any, Optional
 import logging
+import re
 
 from sdk_agent.utils import expand_file_path
 from sdk_agent.exceptions import SDKAgentError
@@ -33,6 +34,22 @@ class ValidationHook:
     and ensure data quality.
     """
 
+    # Path fragments that indicate traversal or access to system locations
+    DANGEROUS_PATH_PATTERNS = (
+        "../", "..\\",
+        "/etc/", "/sys/", "/root/", "/proc/",
+        "C:\\Windows", "C:\\Program Files"
+    )
+
+    # Output locations that exports must never write into
+    SYSTEM_PATH_PREFIXES = (
+        "/etc/", "/sys/", "/root/", "/bin/", "/usr/",
+        "C:\\Windows", "C:\\Program Files"
+    )
+
+    # Compiled once so every validation is a single scan of the path
+    _DANGEROUS_PATH_RE = re.compile("|".join(map(re.escape, DANGEROUS_PATH_PATTERNS)))
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize validation hook.
@@ -108,23 +125,18 @@ class ValidationHook:
             }
 
         # Check for path traversal attempts
-        dangerous_patterns = [
-            "../", "..\\",
-            "/etc/", "/sys/", "/root/", "/proc/",
-            "C:\\Windows", "C:\\Program Files"
-        ]
-
-        for pattern in dangerous_patterns:
-            if pattern in file_path:
-                logger.warning(f"Path traversal attempt detected: {pattern} in {file_path}")
-                return {
-                    "allowed": False,
-                    "reason": (
-                        f"Security: Dangerous path pattern detected: {pattern}\n"
-                        f"Path: {file_path}\n"
-                        "Please use a safe file path within your workspace."
-                    )
-                }
+        match = self._DANGEROUS_PATH_RE.search(file_path)
+        if match:
+            pattern = match.group()
+            logger.warning(f"Path traversal attempt detected: {pattern} in {file_path}")
+            return {
+                "allowed": False,
+                "reason": (
+                    f"Security: Dangerous path pattern detected: {pattern}\n"
+                    f"Path: {file_path}\n"
+                    "Please use a safe file path within your workspace."
+                )
+            }
 
         # Validate path can be expanded safely
         try:
@@ -170,12 +182,7 @@ class ValidationHook:
             }
 
         # Prevent overwriting system files
-        system_paths = [
-            "/etc/", "/sys/", "/root/", "/bin/", "/usr/",
-            "C:\\Windows", "C:\\Program Files"
-        ]
-
-        for sys_path in system_paths:
+        for sys_path in self.SYSTEM_PATH_PREFIXES:
             if output_path.startswith(sys_path):
                 logger.warning(f"Attempt to write to system path: {output_path}")
                 return {
@@ -0,0 +1,165 @@
+"""
+Performance Benchmarks for GraphBuilder hot paths.
+
+Measures how graph construction and traversal scale with graph size:
+- build_from_analysis_results
+- find_all_dependencies
+- find_shortest_path
+- _is_custom_model type classification
+
+Run with: pytest tests/benchmarks/test_graph_hot_paths.py -n 0 --benchmark-only
+Export for trend tracking: add --benchmark-json=graph_hot_paths.json
+"""
+
+import pytest
+
+# Skip before any benchmark marker is evaluated (--strict-markers)
+pytest.importorskip(
+    "pytest_benchmark",
+    reason="pytest-benchmark not installed. Install with: pip install pytest-benchmark"
+)
+
+from graph.graph_builder import GraphBuilder
+
+
+# Total node counts; controllers, services, mappers and tables get a quarter each
+GRAPH_SIZES = [1_000, 10_000, 50_000]
+
+
+def make_synthetic_results(n_controllers, n_services, fanout):
+    """
+    Generate analysis_results for a layered Controller -> Service -> Mapper -> Table graph.
+
+    Args:
+        n_controllers: Number of controller results
+        n_services: Number of service results (one mapper and table per service)
+        fanout: Number of services each controller depends on
+
+    Returns:
+        Dictionary in the build_from_analysis_results input format
+    """
+    results = {}
+
+    for i in range(n_services):
+        results[f"mapper/Mapper{i}.xml"] = {
+            "agent": "mapper",
+            "analysis": {
+                "namespace": f"com.example.Mapper{i}",
+                "tables_accessed": [f"TABLE_{i}"],
+            },
+            "confidence": 0.9,
+        }
+        results[f"service/Service{i}.java"] = {
+            "agent": "service",
+            "analysis": {
+                "class_name": f"Service{i}",
+                "package": "com.example",
+                "dependencies": [
+                    {"type": f"Mapper{i}", "field_name": "mapper", "purpose": "repository"}
+                ],
+            },
+            "confidence": 0.9,
+        }
+
+    for i in range(n_controllers):
+        results[f"controller/Controller{i}.java"] = {
+            "agent": "controller",
+            "analysis": {
+                "class_name": f"Controller{i}",
+                "package": "com.example",
+                "dependencies": [
+                    {"type": f"Service{(i + k) % n_services}", "field_name": f"service{k}"}
+                    for k in range(fanout)
+                ],
+            },
+            "confidence": 0.9,
+        }
+
+    return results
+
+
+def _synthetic_for(n_nodes):
+    """Synthetic results totalling roughly n_nodes graph nodes."""
+    quarter = n_nodes // 4
+    return make_synthetic_results(quarter, quarter, fanout=3)
+
+
+@pytest.fixture(scope="module", params=GRAPH_SIZES, ids=lambda n: f"{n}_nodes")
+def built_graph(request):
+    """Prebuilt synthetic graph per size, shared by the query benchmarks."""
+    builder = GraphBuilder()
+    builder.build_from_analysis_results(_synthetic_for(request.param))
+    return builder
+
+
+class TestGraphBuildPerformance:
+    """Benchmark graph construction."""
+
+    @pytest.mark.benchmark(group="graph_build")
+    @pytest.mark.parametrize("n_nodes", GRAPH_SIZES, ids=lambda n: f"{n}_nodes")
+    def test_build_from_analysis_results(self, benchmark, n_nodes):
+        """Benchmark building a graph from synthetic analysis results."""
+        synth = _synthetic_for(n_nodes)
+
+        nodes_added, _ = benchmark.pedantic(
+            lambda builder: builder.build_from_analysis_results(synth),
+            setup=lambda: ((GraphBuilder(),), {}),
+            rounds=5,
+            iterations=1
+        )
+
+        # Table nodes are created while extracting edges and are not counted here
+        assert nodes_added == 3 * (n_nodes // 4)
+
+
+class TestGraphQueryPerformance:
+    """Benchmark traversal queries on prebuilt graphs."""
+
+    @pytest.mark.benchmark(group="graph_dependencies")
+    def test_find_all_dependencies(self, benchmark, built_graph):
+        """Benchmark transitive dependency lookup from a controller."""
+        deps = benchmark(built_graph.find_all_dependencies, "com.example.Controller0")
+
+        # 3 services, each with one mapper and one table
+        assert len(deps) == 9
+
+    @pytest.mark.benchmark(group="graph_shortest_path")
+    def test_find_shortest_path(self, benchmark, built_graph):
+        """Benchmark shortest path from a controller to a table."""
+        path = benchmark(built_graph.find_shortest_path, "com.example.Controller0", "table:TABLE_0")
+
+        assert [n.id for n in path] == [
+            "com.example.Controller0",
+            "com.example.Service0",
+            "mapper:com.example.Mapper0",
+            "table:TABLE_0",
+        ]
+
+
+class TestTypeClassificationPerformance:
+    """Benchmark per-type model classification used during graph builds."""
+
+    TYPE_NAMES = [
+        "int", "String", "java.util.List", "org.springframework.ui.Model",
+        "List<User>", "com.example.User", "UserDTO", "javax.servlet.HttpServletRequest",
+    ]
+    CALLS = 10_000
+
+    @pytest.mark.benchmark(group="graph_is_custom_model")
+    def test_is_custom_model(self, benchmark):
+        """Benchmark 10k classifications of a handful of repeated type names."""
+        builder = GraphBuilder()
+        type_names = (self.TYPE_NAMES * (self.CALLS // len(self.TYPE_NAMES) + 1))[:self.CALLS]
+        before = builder._is_custom_model.cache_info()
+
+        def classify_all():
+            is_custom_model = builder._is_custom_model
+            for type_name in type_names:
+                is_custom_model(type_name)
+
+        benchmark(classify_all)
+
+        # Each distinct name is classified at most once; the rest are memo hits
+        after = builder._is_custom_model.cache_info()
+        assert after.misses - before.misses <= len(self.TYPE_NAMES)
+        assert after.hits - before.hits >= self.CALLS - len(self.TYPE_NAMES)
@@ -0,0 +1,22 @@
+"""
+Suite-wide pytest configuration.
+
+Under pytest-xdist, tests are grouped per file (matching ``--dist=loadfile``)
+and every ``@pytest.mark.serial`` test is pinned to one shared group so
+tests touching shared on-disk state never run concurrently.
+"""
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """Assign xdist groups when running under pytest-xdist."""
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+
+    for item in items:
+        if item.get_closest_marker("serial"):
+            group = "serial"
+        else:
+            group = item.nodeid.split("::", 1)[0]
+        item.add_marker(pytest.mark.xdist_group(name=group))
@@ -15,9 +15,9 @@ import asyncio
 from mcp.server import SpringMVCAnalyzerServer
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def temp_config():
-    """Create temporary config file."""
+    """Create temporary config file (read-only, shared by the module)."""
     config_data = """
 models:
   haiku: claude-3-5-haiku-20241022
@@ -15,9 +15,9 @@ import json
 from mcp.server import SpringMVCAnalyzerServer
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def passive_config():
-    """Create passive mode configuration."""
+    """Create passive mode configuration (read-only, shared by the module)."""
     config_data = """
 server:
   mode: "passive"
@@ -0,0 +1,39 @@
+"""
+Shared fixtures for SDK Agent tests.
+
+Constructing SpringMVCAnalyzerAgent wires an MCP server, five hooks and
+the full tool list, so read-only tests share a single session instance.
+"""
+
+import copy
+
+import pytest
+
+from sdk_agent.client import SpringMVCAnalyzerAgent
+
+
+@pytest.fixture(scope="session")
+def shared_agent():
+    """Default-configured agent built once per test session."""
+    return SpringMVCAnalyzerAgent()
+
+
+@pytest.fixture
+def agent(shared_agent):
+    """
+    Copy of the shared agent whose config and client can be mutated.
+
+    The hook objects and MCP server are still shared with shared_agent;
+    tests that change those need their own SpringMVCAnalyzerAgent.
+    """
+    clone = copy.copy(shared_agent)
+    clone.config = shared_agent.config.model_copy()
+    clone.client = copy.copy(shared_agent.client)
+    clone.hooks = list(shared_agent.hooks)
+    return clone
+
+
+@pytest.fixture(scope="session")
+def hooks_agent(request):
+    """Agent built with ``hooks_enabled`` set via indirect parametrization."""
+    return SpringMVCAnalyzerAgent(hooks_enabled=request.param)
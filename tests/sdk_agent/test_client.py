@@ -1,8 +1,6 @@
 """Tests for SDK Agent client."""
 
 import pytest
-import tempfile
-import os
 
 from sdk_agent.client import SpringMVCAnalyzerAgent
 from sdk_agent.exceptions import AgentNotInitializedError
@@ -25,7 +23,7 @@ class TestSpringMVCAnalyzerAgent:
         assert agent.config.hooks_enabled is True
         assert agent.system_prompt is not None
 
-    def test_initialization_with_config(self):
+    def test_initialization_with_config(self, tmp_path):
         """Test agent initialization with config file."""
         config_data = """
 server:
@@ -36,21 +34,14 @@ sdk_agent:
   permission_mode: "acceptAll"
   hooks_enabled: false
 """
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as f:
-            f.write(config_data)
-            config_path = f.name
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(config_data)
 
-        try:
-            agent = SpringMVCAnalyzerAgent(config_path=config_path)
+        agent = SpringMVCAnalyzerAgent(config_path=str(config_path))
 
-            assert agent.config.max_turns == 50
-            assert agent.config.permission_mode == "acceptAll"
-            assert agent.config.hooks_enabled is False
-
-        finally:
-            os.unlink(config_path)
+        assert agent.config.max_turns == 50
+        assert agent.config.permission_mode == "acceptAll"
+        assert agent.config.hooks_enabled is False
 
     def test_initialization_with_custom_prompt(self):
         """Test agent initialization with custom system prompt."""
@@ -72,10 +63,28 @@ sdk_agent:
         assert agent.config.permission_mode == "acceptAll"
         assert agent.config.max_turns == 100
 
+    def test_initialization_with_loaded_config(self, monkeypatch):
+        """Test a pre-loaded config is used as a copy without re-reading the file."""
+        from sdk_agent import client
+        from sdk_agent.config import load_config
+
+        config = load_config()
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("config file loaded again")
+
+        monkeypatch.setattr(client, "load_config", fail_load)
+
+        agent = SpringMVCAnalyzerAgent(config=config, max_turns=7)
+
+        assert agent.config.max_turns == 7
+        assert agent.config.mode == config.mode
+        assert config.max_turns != 7
+
     @pytest.mark.asyncio
-    async def test_start_interactive_not_implemented(self):
+    async def test_start_interactive_not_implemented(self, shared_agent):
         """Test start_interactive raises error (Phase 5)."""
-        agent = SpringMVCAnalyzerAgent()
+        agent = shared_agent
 
         with pytest.raises(
             AgentNotInitializedError,
@@ -84,9 +93,9 @@ sdk_agent:
             await agent.start_interactive()
 
     @pytest.mark.asyncio
-    async def test_analyze_project_not_implemented(self):
+    async def test_analyze_project_not_implemented(self, shared_agent):
         """Test analyze_project raises error (Phase 5)."""
-        agent = SpringMVCAnalyzerAgent()
+        agent = shared_agent
 
         with pytest.raises(
             AgentNotInitializedError,
@@ -95,9 +104,9 @@ sdk_agent:
             await agent.analyze_project("src/main/java")
 
     @pytest.mark.asyncio
-    async def test_set_model_not_implemented(self):
+    async def test_set_model_not_implemented(self, shared_agent):
         """Test set_model raises error (Phase 5)."""
-        agent = SpringMVCAnalyzerAgent()
+        agent = shared_agent
 
         with pytest.raises(
             AgentNotInitializedError,
@@ -118,9 +127,9 @@ sdk_agent:
             await agent.set_permission_mode("invalid")
 
     @pytest.mark.asyncio
-    async def test_interrupt_not_implemented(self):
+    async def test_interrupt_not_implemented(self, shared_agent):
         """Test interrupt raises error (Phase 5)."""
-        agent = SpringMVCAnalyzerAgent()
+        agent = shared_agent
 
         with pytest.raises(
             AgentNotInitializedError,
@@ -128,41 +137,37 @@ sdk_agent:
         ):
             await agent.interrupt()
 
-    def test_get_config(self):
+    def test_get_config(self, shared_agent):
         """Test get_config."""
-        agent = SpringMVCAnalyzerAgent()
+        agent = shared_agent
 
         config = agent.get_config()
         assert config.mode == SERVER_MODE_SDK_AGENT
 
-    def test_get_tools(self):
+    def test_get_tools(self, shared_agent):
         """Test get_tools."""
-        agent = SpringMVCAnalyzerAgent()
+        agent = shared_agent
 
         tools = agent.get_tools()
         assert isinstance(tools, list)
 
-    def test_get_hooks(self):
+    def test_get_hooks(self, shared_agent):
         """Test get_hooks."""
-        agent = SpringMVCAnalyzerAgent()
+        agent = shared_agent
 
         hooks = agent.get_hooks()
         assert isinstance(hooks, list)
 
-    def test_system_prompt_caching(self):
+    def test_system_prompt_caching(self, tmp_path):
         """Test system prompt is cached."""
         prompt_content = "Test prompt for caching"
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".md", delete=False
-        ) as f:
-            f.write(prompt_content)
-            prompt_path = f.name
+        prompt_path = tmp_path / "prompt.md"
+        prompt_path.write_text(prompt_content)
 
-        try:
-            # Create config with prompt path (use forward slashes for YAML compatibility)
-            prompt_path_yaml = prompt_path.replace("\\", "/")
-            config_data = f"""
+        # Create config with prompt path (use forward slashes for YAML compatibility)
+        prompt_path_yaml = str(prompt_path).replace("\\", "/")
+        config_data = f"""
 server:
   mode: "sdk_agent"
 
@@ -170,23 +175,13 @@ sdk_agent:
   prompts:
     system_prompt_path: "{prompt_path_yaml}"
 """
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".yaml", delete=False
-            ) as cf:
-                cf.write(config_data)
-                config_path = cf.name
-
-            try:
-                # First agent
-                agent1 = SpringMVCAnalyzerAgent(config_path=config_path)
-                assert agent1.system_prompt == prompt_content
-
-                # Second agent - should use cached prompt
-                agent2 = SpringMVCAnalyzerAgent(config_path=config_path)
-                assert agent2.system_prompt == prompt_content
-
-            finally:
-                os.unlink(config_path)
-
-        finally:
-            os.unlink(prompt_path)
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(config_data)
+
+        # First agent
+        agent1 = SpringMVCAnalyzerAgent(config_path=str(config_path))
+        assert agent1.system_prompt == prompt_content
+
+        # Second agent - should use cached prompt
+        agent2 = SpringMVCAnalyzerAgent(config_path=str(config_path))
+        assert agent2.system_prompt == prompt_content
@@ -6,15 +6,29 @@ error reporting across all SDK Agent components.
 """
 
 import pytest
-from unittest.mock import Mock, patch, ANY
+from unittest.mock import Mock, ANY
 import logging
 
+from sdk_agent import error_formatter
 from sdk_agent.error_formatter import (
     ErrorFormatter,
     log_structured_error
 )
 
 
+@pytest.fixture(scope="module")
+def _shared_logger_mock():
+    """Build the spec'd logger mock once per module."""
+    return Mock(spec=logging.Logger)
+
+
+@pytest.fixture
+def logger_mock(_shared_logger_mock):
+    """Provide the shared logger mock, reset after each test."""
+    yield _shared_logger_mock
+    _shared_logger_mock.reset_mock()
+
+
 class TestErrorFormatter:
     """Test ErrorFormatter class methods."""
 
@@ -249,12 +263,12 @@ class TestProcessingErrorFormatting:
 class TestStructuredLogging:
     """Test structured error logging functionality."""
 
-    @patch('sdk_agent.error_formatter.ErrorFormatter.format_error_message')
-    def test_log_structured_error(self, mock_format):
+    def test_log_structured_error(self, monkeypatch, logger_mock):
         """Test structured error logging."""
-        mock_format.return_value = "Formatted error message"
+        mock_format = Mock(return_value="Formatted error message")
+        monkeypatch.setattr(ErrorFormatter, "format_error_message", mock_format)
 
-        logger = Mock(spec=logging.Logger)
+        logger = logger_mock
         error = ValueError("Test error")
         context = {"key": "value"}
 
@@ -281,9 +295,9 @@ class TestStructuredLogging:
             exc_info=True
         )
 
-    def test_log_structured_error_different_levels(self):
+    def test_log_structured_error_different_levels(self, logger_mock):
         """Test logging at different levels."""
-        logger = Mock(spec=logging.Logger)
+        logger = logger_mock
         error = Warning("Warning message")
 
         # Test with WARNING level
@@ -304,55 +318,41 @@ class TestStructuredLogging:
 class TestErrorMessageConsistency:
     """Test consistency of error message formats."""
 
-    def test_all_error_types_include_type_marker(self):
-        """Test that all error types include the error type marker."""
-        # Test each formatting method
-        file_error = ErrorFormatter.format_file_error(
-            "test.java",
-            FileNotFoundError("not found"),
-            "read"
-        )
-        assert file_error.startswith("[FileNotFoundError]")
-
-        validation_error = ErrorFormatter.format_validation_error(
-            "field", "value", "expected"
-        )
-        assert validation_error.startswith("[ValidationError]")
-
-        config_error = ErrorFormatter.format_configuration_error(
-            "param", "value", "range"
-        )
-        assert config_error.startswith("[ConfigurationError]")
-
-        processing_error = ErrorFormatter.format_processing_error(
-            "item", ValueError("error")
-        )
-        assert processing_error.startswith("[ProcessingError]")
-
-    def test_consistent_structure(self):
-        """Test that all errors have consistent structure."""
-        errors = [
-            ErrorFormatter.format_file_error(
-                "test.java", IOError("error"), "read"
+    @pytest.mark.parametrize("build_error,type_marker", [
+        (
+            lambda: ErrorFormatter.format_file_error(
+                "test.java", FileNotFoundError("not found"), "read"
             ),
-            ErrorFormatter.format_validation_error(
+            "[FileNotFoundError]",
+        ),
+        (
+            lambda: ErrorFormatter.format_validation_error(
                 "field", "value", "expected"
             ),
-            ErrorFormatter.format_configuration_error(
+            "[ValidationError]",
+        ),
+        (
+            lambda: ErrorFormatter.format_configuration_error(
                 "param", "value", "range"
             ),
-            ErrorFormatter.format_processing_error(
+            "[ConfigurationError]",
+        ),
+        (
+            lambda: ErrorFormatter.format_processing_error(
                 "item", ValueError("error")
-            )
-        ]
+            ),
+            "[ProcessingError]",
+        ),
+    ], ids=["file", "validation", "configuration", "processing"])
+    def test_type_marker_and_consistent_structure(self, build_error, type_marker):
+        """Test that each error type has its marker and a consistent structure."""
+        error_msg = build_error()
 
-        for error_msg in errors:
-            # All should have error type marker
-            assert error_msg.startswith("[")
-            assert "]" in error_msg
+        # All should start with their error type marker
+        assert error_msg.startswith(type_marker)
 
-            # All should have context or suggestions
-            assert "Context:" in error_msg or "Suggestions:" in error_msg
+        # All should have context or suggestions
+        assert "Context:" in error_msg or "Suggestions:" in error_msg
 
 
 class TestEdgeCases:
@@ -692,7 +692,13 @@ class TestConfigurableTruncationLimits:
 class TestTruncationLogging:
     """Test logging of truncation events."""
 
-    @patch('sdk_agent.error_formatter.logger')
+    @pytest.fixture
+    def mock_logger(self, monkeypatch):
+        """Replace the formatter module logger with a mock."""
+        mock = Mock()
+        monkeypatch.setattr(error_formatter, "logger", mock)
+        return mock
+
     def test_logs_individual_value_truncation(self, mock_logger):
         """Test that individual value truncation is logged."""
         large_value = "x" * 1000
@@ -710,7 +716,6 @@ class TestTruncationLogging:
         assert any("Truncated context value" in call for call in debug_calls)
         assert any("large_field" in call for call in debug_calls)
 
-    @patch('sdk_agent.error_formatter.logger')
     def test_logs_total_context_truncation(self, mock_logger):
         """Test that total context truncation is logged."""
         # Create context exceeding total limit
@@ -728,7 +733,6 @@ class TestTruncationLogging:
         debug_calls = [call[0][0] for call in mock_logger.debug.call_args_list]
         assert any("Total context length exceeded" in call for call in debug_calls)
 
-    @patch('sdk_agent.error_formatter.logger')
     def test_logs_truncation_count(self, mock_logger):
         """Test that truncation count is logged."""
         context = {
@@ -750,7 +754,6 @@ class TestTruncationLogging:
         # Check that count information is in logs
         assert any("Truncated" in call for call in debug_calls)
 
-    @patch('sdk_agent.error_formatter.logger')
     def test_no_logging_when_no_truncation(self, mock_logger):
         """Test that no debug logs when truncation doesn't occur."""
         small_context = {"field": "small value"}
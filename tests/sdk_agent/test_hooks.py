@@ -5,10 +5,13 @@ Tests the five hook types: PreToolUse, PostToolUse, PreCompact,
 UserPromptSubmit, and Stop hooks.
 """
 
+import json
+import os
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from pathlib import Path
 
+from sdk_agent.hooks import cache
 from sdk_agent.hooks.validation import ValidationHook
 from sdk_agent.hooks.cache import CacheHook
 from sdk_agent.hooks.cleanup import CleanupHook
@@ -16,13 +19,40 @@ from sdk_agent.hooks.context_manager import ContextManagerHook
 from sdk_agent.hooks.input_enhancement import InputEnhancementHook
 
 
+def _hook_config(request, tmp_path_factory, enabled):
+    """
+    Build the test class's hook config.
+
+    A class listing config keys in ``hook_tmp_dirs`` gets a fresh temporary
+    directory for each, so parallel workers never share on-disk state.
+    """
+    config = {**getattr(request.cls, "hook_config", {}), "enabled": enabled}
+    for key in getattr(request.cls, "hook_tmp_dirs", ()):
+        config[key] = str(tmp_path_factory.mktemp(key))
+    return config
+
+
+@pytest.fixture(scope="class")
+def enabled_hook(request, tmp_path_factory):
+    """Enabled instance of the test class's ``hook_class``, built once per class."""
+    return request.cls.hook_class(_hook_config(request, tmp_path_factory, True))
+
+
+@pytest.fixture(scope="class")
+def disabled_hook(request, tmp_path_factory):
+    """Disabled instance of the test class's ``hook_class``, built once per class."""
+    return request.cls.hook_class(_hook_config(request, tmp_path_factory, False))
+
+
 class TestValidationHook:
     """Test PreToolUse validation hook."""
 
+    hook_class = ValidationHook
+
     @pytest.mark.asyncio
-    async def test_validation_hook_enabled(self):
+    async def test_validation_hook_enabled(self, enabled_hook):
         """Test validation hook when enabled."""
-        hook = ValidationHook({"enabled": True})
+        hook = enabled_hook
 
         result = await hook(
             tool_name="analyze_controller",
@@ -34,9 +64,9 @@ class TestValidationHook:
         assert result.get("allowed") is not False
 
     @pytest.mark.asyncio
-    async def test_validation_hook_disabled(self):
+    async def test_validation_hook_disabled(self, disabled_hook):
         """Test validation hook when disabled."""
-        hook = ValidationHook({"enabled": False})
+        hook = disabled_hook
 
         result = await hook(
             tool_name="analyze_controller",
@@ -84,13 +114,13 @@ class TestValidationHook:
 class TestCacheHook:
     """Test PostToolUse cache hook."""
 
+    hook_class = CacheHook
+    hook_tmp_dirs = ("cache_dir",)
+
     @pytest.mark.asyncio
-    async def test_cache_hook_enabled(self):
+    async def test_cache_hook_enabled(self, enabled_hook):
         """Test cache hook stores results."""
-        hook = CacheHook({
-            "enabled": True,
-            "cache_dir": ".cache/test"
-        })
+        hook = enabled_hook
 
         tool_output = {
             "content": [{"type": "text", "text": "Analysis result"}],
@@ -108,9 +138,9 @@ class TestCacheHook:
         assert result.get("content") == tool_output["content"]
 
     @pytest.mark.asyncio
-    async def test_cache_hook_disabled(self):
+    async def test_cache_hook_disabled(self, disabled_hook):
         """Test cache hook when disabled."""
-        hook = CacheHook({"enabled": False})
+        hook = disabled_hook
 
         tool_output = {
             "content": [{"type": "text", "text": "Analysis result"}]
@@ -127,12 +157,9 @@ class TestCacheHook:
         assert result == {}
 
     @pytest.mark.asyncio
-    async def test_cache_key_generation(self):
+    async def test_cache_key_generation(self, enabled_hook):
         """Test that cache keys are generated correctly."""
-        hook = CacheHook({
-            "enabled": True,
-            "cache_dir": ".cache/test"
-        })
+        hook = enabled_hook
 
         # Same input should generate same cache key
         tool_input1 = {"file_path": "test.java", "include_details": True}
@@ -159,14 +186,48 @@ class TestCacheHook:
             # Should have been called twice with same inputs
             assert mock_gen.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_one_cache_file_per_tool_and_file(self, tmp_path):
+        """Test different inputs for one file overwrite a single entry holding the key."""
+        hook = CacheHook({"enabled": True, "cache_dir": str(tmp_path)})
+
+        for include_details in (True, False):
+            tool_input = {"file_path": "src/UserController.java", "include_details": include_details}
+            await hook(
+                tool_name="analyze_controller",
+                tool_input=tool_input,
+                tool_output={"content": []},
+                context={}
+            )
+
+        assert [p.name for p in tmp_path.iterdir()] == ["analyze_controller_UserController.java.json"]
+        cached = json.loads((tmp_path / "analyze_controller_UserController.java.json").read_text())
+        assert cached["cache_key"] == hook._generate_cache_key("analyze_controller", tool_input)
+        assert cached["input"] == tool_input
+
+    @pytest.mark.parametrize("tool_input", [
+        {"file_path": "src/控制器/用户Controller.java", "note": "é"},
+        {"threshold": float("nan"), "limits": [float("inf"), -float("inf"), 0.5]},
+    ])
+    def test_cache_key_independent_of_orjson(self, enabled_hook, monkeypatch, tool_input):
+        """Test orjson and the stdlib fallback produce the same cache key."""
+        key_with_orjson = enabled_hook._generate_cache_key("analyze_controller", tool_input)
+
+        monkeypatch.setattr(cache, "orjson", None)
+        key_with_json = enabled_hook._generate_cache_key("analyze_controller", tool_input)
+
+        assert key_with_orjson == key_with_json
+
 
 class TestCleanupHook:
     """Test Stop hook for cleanup."""
 
+    hook_class = CleanupHook
+
     @pytest.mark.asyncio
-    async def test_cleanup_hook_enabled(self):
+    async def test_cleanup_hook_enabled(self, enabled_hook):
         """Test cleanup hook performs cleanup."""
-        hook = CleanupHook({"enabled": True})
+        hook = enabled_hook
 
         result = await hook(
             context={"session_id": "test123"}
@@ -176,9 +237,9 @@ class TestCleanupHook:
         assert isinstance(result, dict)
 
     @pytest.mark.asyncio
-    async def test_cleanup_hook_disabled(self):
+    async def test_cleanup_hook_disabled(self, disabled_hook):
         """Test cleanup hook when disabled."""
-        hook = CleanupHook({"enabled": False})
+        hook = disabled_hook
 
         result = await hook(
             context={"session_id": "test123"}
@@ -187,28 +248,16 @@ class TestCleanupHook:
         # Should pass through
         assert result == {}
 
-    @pytest.mark.asyncio
-    async def test_temporary_file_cleanup(self):
-        """Test that temporary files are cleaned up."""
-        hook = CleanupHook({
-            "enabled": True,
-            "clean_temp_files": True
-        })
-
-        with patch('sdk_agent.hooks.cleanup.cleanup_temp_files') as mock_cleanup:
-            await hook(context={})
-
-            # Depending on implementation, cleanup may be called
-            # This test validates the hook structure
-
 
 class TestContextManagerHook:
     """Test PreCompact context manager hook."""
 
+    hook_class = ContextManagerHook
+
     @pytest.mark.asyncio
-    async def test_context_manager_hook_enabled(self):
+    async def test_context_manager_hook_enabled(self, enabled_hook):
         """Test context manager hook."""
-        hook = ContextManagerHook({"enabled": True})
+        hook = enabled_hook
 
         messages = [
             {"role": "user", "content": "Query 1"},
@@ -227,9 +276,9 @@ class TestContextManagerHook:
         assert "messages" in result or result == {}
 
     @pytest.mark.asyncio
-    async def test_context_manager_disabled(self):
+    async def test_context_manager_disabled(self, disabled_hook):
         """Test context manager when disabled."""
-        hook = ContextManagerHook({"enabled": False})
+        hook = disabled_hook
 
         messages = [
             {"role": "user", "content": "Query"},
@@ -252,10 +301,11 @@ class TestContextManagerHook:
             "preserve_recent": 3
         })
 
-        messages = []
-        for i in range(10):
-            messages.append({"role": "user", "content": f"Query {i}"})
-            messages.append({"role": "assistant", "content": f"Response {i}"})
+        messages = [
+            {"role": role, "content": f"{label} {i}"}
+            for i in range(10)
+            for role, label in (("user", "Query"), ("assistant", "Response"))
+        ]
 
         with patch.object(hook, '_select_important_messages') as mock_select:
             mock_select.return_value = messages[-6:]  # Last 3 exchanges
@@ -272,10 +322,12 @@ class TestContextManagerHook:
 class TestInputEnhancementHook:
     """Test UserPromptSubmit input enhancement hook."""
 
+    hook_class = InputEnhancementHook
+
     @pytest.mark.asyncio
-    async def test_input_enhancement_enabled(self):
+    async def test_input_enhancement_enabled(self, enabled_hook):
         """Test input enhancement hook."""
-        hook = InputEnhancementHook({"enabled": True})
+        hook = enabled_hook
 
         user_input = "分析 UserController.java"
 
@@ -288,9 +340,9 @@ class TestInputEnhancementHook:
         assert "enhanced_input" in result or result == {}
 
     @pytest.mark.asyncio
-    async def test_input_enhancement_disabled(self):
+    async def test_input_enhancement_disabled(self, disabled_hook):
         """Test input enhancement when disabled."""
-        hook = InputEnhancementHook({"enabled": False})
+        hook = disabled_hook
 
         user_input = "分析 UserController.java"
 
@@ -323,6 +375,43 @@ class TestInputEnhancementHook:
             # Path expansion may be applied
             # This validates hook structure
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("user_input, expected", [
+        ("~/project/UserController.java", "{home}project/UserController.java"),
+        ("分析 ~/project/UserController.java", "分析 {home}project/UserController.java"),
+        ("比較 ~/a.java\t~/b.java", "比較 {home}a.java\t{home}b.java"),
+    ])
+    async def test_home_paths_expanded(self, enabled_hook, user_input, expected):
+        """Test ~/ is expanded at the start of the input and after whitespace."""
+        home = str(Path.home()) + os.sep
+
+        result = await enabled_hook(user_input=user_input, context={})
+
+        assert result == {"enhanced_input": expected.format(home=home)}
+
+    @pytest.mark.asyncio
+    async def test_mid_word_tilde_not_expanded(self, enabled_hook):
+        """Test ~/ inside a word is left alone."""
+        result = await enabled_hook(user_input="分析 a~/b.java", context={})
+
+        assert "enhanced_input" not in result
+
+    @pytest.mark.asyncio
+    async def test_expand_paths_disabled(self):
+        """Test expand_paths=False leaves ~/ untouched."""
+        hook = InputEnhancementHook({"enabled": True, "expand_paths": False})
+
+        result = await hook(user_input="分析 ~/project/UserController.java", context={})
+
+        assert "enhanced_input" not in result
+
+    @pytest.mark.asyncio
+    async def test_unchanged_input_has_no_enhanced_input(self, enabled_hook):
+        """Test input with nothing to enhance returns no enhanced_input key."""
+        result = await enabled_hook(user_input="分析 UserController.java", context={})
+
+        assert result == {}
+
     @pytest.mark.asyncio
     async def test_context_addition(self):
         """Test that relevant context is added."""
@@ -351,10 +440,10 @@ class TestHookIntegration:
     """Test hooks working together."""
 
     @pytest.mark.asyncio
-    async def test_hook_chain_execution(self):
+    async def test_hook_chain_execution(self, tmp_path):
         """Test multiple hooks executing in sequence."""
         validation_hook = ValidationHook({"enabled": True})
-        cache_hook = CacheHook({"enabled": True, "cache_dir": ".cache/test"})
+        cache_hook = CacheHook({"enabled": True, "cache_dir": str(tmp_path / "cache")})
 
         tool_input = {"file_path": "test.java"}
         tool_output = {"content": [{"type": "text", "text": "Result"}]}
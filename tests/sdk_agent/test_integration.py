@@ -12,108 +12,100 @@ import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from pathlib import Path
 
-from sdk_agent.client import SpringMVCAnalyzerAgent
+# Skip the whole module at collection time when the SDK is missing
+pytest.importorskip("claude_agent_sdk", reason="Claude Agent SDK not installed - integration tests skipped")
+
+from sdk_agent.hooks.cache import CacheHook
+from sdk_agent.hooks.validation import ValidationHook
 from sdk_agent.mcp_server_factory import create_analyzer_mcp_server
 from sdk_agent.sdk_tools import ALL_SDK_TOOLS
 
 
+@pytest.fixture(scope="session")
+def tool_count():
+    """Number of tools the SDK agent is expected to expose."""
+    return len(ALL_SDK_TOOLS)
+
+
+@pytest.fixture(scope="session")
+def tool_list(shared_agent):
+    """Tool list of the shared agent, built once per session."""
+    return shared_agent.get_tools()
+
+
+async def _aiter(items):
+    """Yield items as an async iterator."""
+    for item in items:
+        yield item
+
+
+@pytest.fixture(scope="module")
+def _wired_client():
+    """SDK client mock with session and streaming methods wired once per module."""
+    client = AsyncMock()
+    client.__aenter__ = AsyncMock()
+    client.__aexit__ = AsyncMock()
+    client.query = AsyncMock()
+    client.receive_response = lambda: _aiter(["test response"])
+    return client
+
+
+@pytest.fixture
+def wired_client(_wired_client):
+    """Provide the shared client mock, reset after each test."""
+    yield _wired_client
+    _wired_client.reset_mock()
+
+
 class TestSDKIntegration:
     """Test SDK Agent integration."""
 
-    @pytest.mark.skipif(
-        not _check_sdk_available(),
-        reason="Claude Agent SDK not installed"
-    )
-    def test_sdk_client_initialization(self):
+    def test_sdk_client_initialization(self, shared_agent):
         """Test SDK client initializes with all components."""
-        agent = SpringMVCAnalyzerAgent()
+        agent = shared_agent
 
         assert agent.client is not None, "SDK client should be initialized"
         assert agent.mcp_server is not None, "MCP server should be created"
         assert len(agent.hooks) == 5, "Should have 5 hooks initialized"
 
-    @pytest.mark.skipif(
-        not _check_sdk_available(),
-        reason="Claude Agent SDK not installed"
-    )
-    def test_tools_registered(self):
+    def test_tools_registered(self, tool_list, tool_count):
         """Test all tools are registered with SDK."""
-        agent = SpringMVCAnalyzerAgent()
+        assert len(tool_list) == tool_count == 11, f"Expected 11 tools, got {len(tool_list)}"
 
-        tools = agent.get_tools()
-        assert len(tools) == 11, f"Expected 11 tools, got {len(tools)}"
-
-    @pytest.mark.skipif(
-        not _check_sdk_available(),
-        reason="Claude Agent SDK not installed"
-    )
-    def test_hooks_enabled(self):
+    @pytest.mark.parametrize("hooks_agent", [True], indirect=True)
+    def test_hooks_enabled(self, hooks_agent):
         """Test hooks are enabled when configured."""
-        agent = SpringMVCAnalyzerAgent(hooks_enabled=True)
+        agent = hooks_agent
 
         assert agent.config.hooks_enabled is True
         assert len(agent.hooks) == 5
         # Verify each hook is initialized
         assert all(hook is not None for hook in agent.hooks)
 
-    @pytest.mark.skipif(
-        not _check_sdk_available(),
-        reason="Claude Agent SDK not installed"
-    )
-    def test_hooks_disabled(self):
+    @pytest.mark.parametrize("hooks_agent", [False], indirect=True)
+    def test_hooks_disabled(self, hooks_agent):
         """Test hooks can be disabled."""
-        agent = SpringMVCAnalyzerAgent(hooks_enabled=False)
+        agent = hooks_agent
 
         assert agent.config.hooks_enabled is False
         # Hooks are still created but not registered with SDK
 
     def test_mcp_server_creation(self):
         """Test MCP server factory."""
-        if not _check_sdk_available():
-            pytest.skip("Claude Agent SDK not installed")
-
         server = create_analyzer_mcp_server()
         assert server is not None
 
-    @pytest.mark.skipif(
-        not _check_sdk_available(),
-        reason="Claude Agent SDK not installed"
-    )
-    def test_tool_list_dynamic(self):
+    def test_tool_list_dynamic(self, tool_list, tool_count):
         """Test tool list is generated dynamically."""
-        agent = SpringMVCAnalyzerAgent()
-
         # Should match ALL_SDK_TOOLS count
-        assert len(agent.get_tools()) == len(ALL_SDK_TOOLS)
-
-
-class TestSDKImportHandling:
-    """Test SDK import error handling."""
-
-    def test_sdk_not_installed_error(self):
-        """Test error message when SDK not installed."""
-        with patch('sdk_agent.sdk_imports.check_sdk_installed') as mock_check:
-            mock_check.side_effect = ImportError("SDK not found")
-
-            with pytest.raises(ImportError) as exc_info:
-                from sdk_agent.sdk_imports import import_sdk
-                import_sdk()
-
-            assert "SDK not found" in str(exc_info.value)
+        assert len(tool_list) == tool_count
 
 
 class TestValidationHook:
     """Test ValidationHook integration."""
 
-    @pytest.mark.skipif(
-        not _check_sdk_available(),
-        reason="Claude Agent SDK not installed"
-    )
-    @pytest.mark.asyncio
     async def test_validation_hook_blocks_dangerous_paths(self):
         """Test ValidationHook blocks path traversal attempts."""
-        from sdk_agent.hooks.validation import ValidationHook
-
         hook = ValidationHook({"enabled": True, "strict_mode": True})
 
         # Test dangerous path
@@ -126,15 +118,8 @@ class TestValidationHook:
         assert result["allowed"] is False
         assert "dangerous" in result.get("reason", "").lower()
 
-    @pytest.mark.skipif(
-        not _check_sdk_available(),
-        reason="Claude Agent SDK not installed"
-    )
-    @pytest.mark.asyncio
     async def test_validation_hook_allows_safe_paths(self):
         """Test ValidationHook allows safe paths."""
-        from sdk_agent.hooks.validation import ValidationHook
-
         hook = ValidationHook({"enabled": True})
 
         # Test safe path
@@ -152,16 +137,9 @@ class TestValidationHook:
 class TestCacheHook:
     """Test CacheHook integration."""
 
-    @pytest.mark.skipif(
-        not _check_sdk_available(),
-        reason="Claude Agent SDK not installed"
-    )
-    @pytest.mark.asyncio
-    async def test_cache_hook_saves_results(self, tmp_path):
-        """Test CacheHook saves analysis results."""
-        from sdk_agent.hooks.cache import CacheHook
-
-        cache_dir = tmp_path / ".cache"
+    async def test_cache_hook_saves_results(self, fs):
+        """Test CacheHook saves analysis results (on pyfakefs' in-memory filesystem)."""
+        cache_dir = Path("/project/.cache")
         hook = CacheHook({
             "enabled": True,
             "cache_dir": str(cache_dir)
@@ -185,44 +163,14 @@ class TestCacheHook:
 class TestContextManagerFix:
     """Test that context manager is properly managed."""
 
-    @pytest.mark.skipif(
-        not _check_sdk_available(),
-        reason="Claude Agent SDK not installed"
-    )
-    @pytest.mark.asyncio
-    async def test_client_session_management(self):
+    async def test_client_session_management(self, agent, wired_client):
         """Test client session is properly initialized and cleaned up."""
-        agent = SpringMVCAnalyzerAgent()
-
-        # Mock the client methods
-        agent.client.__aenter__ = AsyncMock()
-        agent.client.__aexit__ = AsyncMock()
-        agent.client.query = AsyncMock()
-
-        async def mock_receive():
-            yield "test response"
-
-        agent.client.receive_response = mock_receive
+        agent.client = wired_client
 
         # Test analyze_project manages session correctly
         result = await agent.analyze_project("test/path")
 
         # Verify __aenter__ and __aexit__ were called
-        agent.client.__aenter__.assert_called_once()
-        agent.client.__aexit__.assert_called_once()
-
-
-def _check_sdk_available():
-    """Check if Claude Agent SDK is available."""
-    try:
-        import claude_agent_sdk
-        return True
-    except ImportError:
-        return False
-
+        wired_client.__aenter__.assert_called_once()
+        wired_client.__aexit__.assert_called_once()
 
-# Skip all tests if SDK not installed
-pytestmark = pytest.mark.skipif(
-    not _check_sdk_available(),
-    reason="Claude Agent SDK not installed - integration tests skipped"
-)
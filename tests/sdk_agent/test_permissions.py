@@ -1,5 +1,7 @@
 """Tests for SDK Agent permissions."""
 
+import functools
+
 import pytest
 
 from sdk_agent.permissions import PermissionManager, create_permission_manager
@@ -14,6 +16,25 @@ from sdk_agent.constants import (
 )
 
 
+@pytest.fixture(scope="session")
+def pm_factory():
+    """
+    Factory returning shared PermissionManagers for read-only tests.
+
+    Custom permissions are passed as a tuple of (tool, decision) pairs so
+    the arguments stay hashable. Tests that mutate the manager construct
+    their own instance.
+    """
+    @functools.lru_cache(maxsize=None)
+    def make(mode=PERMISSION_MODE_ACCEPT_EDITS, custom=None):
+        return PermissionManager(
+            mode=mode,
+            custom_permissions=dict(custom) if custom else None
+        )
+
+    return make
+
+
 class TestPermissionManager:
     """Test PermissionManager class."""
 
@@ -27,51 +48,38 @@ class TestPermissionManager:
         with pytest.raises(ValueError, match="Invalid permission mode"):
             PermissionManager(mode="invalid")
 
-    def test_accept_all_mode(self):
-        """Test acceptAll mode allows all tools."""
-        pm = PermissionManager(mode=PERMISSION_MODE_ACCEPT_ALL)
-
-        assert pm.can_use_tool("analyze_controller") == PERMISSION_ALLOW
-        assert pm.can_use_tool("build_graph") == PERMISSION_ALLOW
-        assert pm.can_use_tool("any_tool") == PERMISSION_ALLOW
-
-    def test_reject_all_mode(self):
-        """Test rejectAll mode confirms all tools."""
-        pm = PermissionManager(mode=PERMISSION_MODE_REJECT_ALL)
-
-        assert pm.can_use_tool("analyze_controller") == PERMISSION_CONFIRM
-        assert pm.can_use_tool("build_graph") == PERMISSION_CONFIRM
-        assert pm.can_use_tool("any_tool") == PERMISSION_CONFIRM
-
-    def test_accept_edits_mode_read_tools(self):
-        """Test acceptEdits mode allows read tools."""
-        pm = PermissionManager(mode=PERMISSION_MODE_ACCEPT_EDITS)
-
-        assert pm.can_use_tool("analyze_controller") == PERMISSION_ALLOW
-        assert pm.can_use_tool("analyze_service") == PERMISSION_ALLOW
-        assert pm.can_use_tool("query_graph") == PERMISSION_ALLOW
-        assert pm.can_use_tool("read_file") == PERMISSION_ALLOW
-
-    def test_accept_edits_mode_edit_tools(self):
-        """Test acceptEdits mode confirms edit tools."""
-        pm = PermissionManager(mode=PERMISSION_MODE_ACCEPT_EDITS)
-
-        assert pm.can_use_tool("build_graph") == PERMISSION_CONFIRM
-        assert pm.can_use_tool("export_graph") == PERMISSION_CONFIRM
-
-    def test_custom_mode(self):
+    @pytest.mark.parametrize("mode,tool,expected", [
+        # acceptAll allows every tool
+        (PERMISSION_MODE_ACCEPT_ALL, "analyze_controller", PERMISSION_ALLOW),
+        (PERMISSION_MODE_ACCEPT_ALL, "build_graph", PERMISSION_ALLOW),
+        (PERMISSION_MODE_ACCEPT_ALL, "any_tool", PERMISSION_ALLOW),
+        # rejectAll confirms every tool
+        (PERMISSION_MODE_REJECT_ALL, "analyze_controller", PERMISSION_CONFIRM),
+        (PERMISSION_MODE_REJECT_ALL, "build_graph", PERMISSION_CONFIRM),
+        (PERMISSION_MODE_REJECT_ALL, "any_tool", PERMISSION_CONFIRM),
+        # acceptEdits allows read tools
+        (PERMISSION_MODE_ACCEPT_EDITS, "analyze_controller", PERMISSION_ALLOW),
+        (PERMISSION_MODE_ACCEPT_EDITS, "analyze_service", PERMISSION_ALLOW),
+        (PERMISSION_MODE_ACCEPT_EDITS, "query_graph", PERMISSION_ALLOW),
+        (PERMISSION_MODE_ACCEPT_EDITS, "read_file", PERMISSION_ALLOW),
+        # acceptEdits confirms edit tools
+        (PERMISSION_MODE_ACCEPT_EDITS, "build_graph", PERMISSION_CONFIRM),
+        (PERMISSION_MODE_ACCEPT_EDITS, "export_graph", PERMISSION_CONFIRM),
+    ])
+    def test_can_use_tool_by_mode(self, pm_factory, mode, tool, expected):
+        """Test built-in modes decide each tool as expected."""
+        assert pm_factory(mode).can_use_tool(tool) == expected
+
+    def test_custom_mode(self, pm_factory):
         """Test custom mode with custom permissions."""
-        custom_perms = {
-            "analyze_controller": PERMISSION_ALLOW,
-            "build_graph": PERMISSION_DENY,
-            "export_graph": PERMISSION_CONFIRM,
-        }
-
-        pm = PermissionManager(
-            mode=PERMISSION_MODE_CUSTOM,
-            custom_permissions=custom_perms
+        custom_perms = (
+            ("analyze_controller", PERMISSION_ALLOW),
+            ("build_graph", PERMISSION_DENY),
+            ("export_graph", PERMISSION_CONFIRM),
         )
 
+        pm = pm_factory(PERMISSION_MODE_CUSTOM, custom_perms)
+
         assert pm.can_use_tool("analyze_controller") == PERMISSION_ALLOW
         assert pm.can_use_tool("build_graph") == PERMISSION_DENY
         assert pm.can_use_tool("export_graph") == PERMISSION_CONFIRM
@@ -99,9 +107,9 @@ class TestPermissionManager:
         with pytest.raises(ValueError, match="Invalid permission"):
             pm.set_custom_permission("tool", "invalid")
 
-    def test_audit_logging(self):
+    def test_audit_logging(self, pm_factory):
         """Test audit logging with context."""
-        pm = PermissionManager()
+        pm = pm_factory()
 
         # Should not raise, just log
         context = {"user": "test", "action": "analyze"}
@@ -109,9 +117,9 @@ class TestPermissionManager:
 
         assert decision == PERMISSION_ALLOW
 
-    def test_get_permissions_summary(self):
+    def test_get_permissions_summary(self, pm_factory):
         """Test getting permissions summary."""
-        pm = PermissionManager(mode=PERMISSION_MODE_ACCEPT_EDITS)
+        pm = pm_factory(PERMISSION_MODE_ACCEPT_EDITS)
         summary = pm.get_permissions_summary()
 
         assert summary["mode"] == PERMISSION_MODE_ACCEPT_EDITS
@@ -0,0 +1,31 @@
+"""
+Tests for SDK import handling.
+
+Kept apart from the integration tests so they run without the
+Claude Agent SDK installed.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from sdk_agent import sdk_imports
+
+
+@pytest.fixture(scope="class")
+def no_sdk():
+    """Make the SDK look uninstalled for every test in the class."""
+    with patch.object(sdk_imports, "check_sdk_installed") as mock_check:
+        mock_check.side_effect = ImportError("SDK not found")
+        yield mock_check
+
+
+@pytest.mark.usefixtures("no_sdk")
+class TestSDKImportHandling:
+    """Test SDK import error handling."""
+
+    def test_sdk_not_installed_error(self):
+        """Test error message when SDK not installed."""
+        with pytest.raises(ImportError) as exc_info:
+            sdk_imports.import_sdk()
+
+        assert "SDK not found" in str(exc_info.value)
@@ -5,11 +5,15 @@ Tests validation, path handling, formatting, and error handling functions
 used across all SDK agent tools.
 """
 
+from types import SimpleNamespace
+
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 import tempfile
 
+from sdk_agent.tools import common
+
 from sdk_agent.tools.common import (
     validate_and_expand_path,
     validate_tool_args,
@@ -19,44 +23,73 @@ from sdk_agent.tools.common import (
 from sdk_agent.exceptions import SDKAgentError
 
 
+@pytest.fixture(scope="session")
+def java_project(tmp_path_factory):
+    """Read-only project tree shared by path validation tests."""
+    root = tmp_path_factory.mktemp("java_project")
+    (root / "test.java").write_text("test content")
+    (root / "src").mkdir()
+    (root / "src" / "Controller.java").write_text("test content")
+    return root
+
+
+@pytest.fixture
+def make_file(tmp_path):
+    """Create files under tmp_path, making each parent directory only once."""
+    created = set()
+
+    def _make(rel, content="x"):
+        path = tmp_path / rel
+        if path.parent not in created:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            created.add(path.parent)
+        path.write_text(content)
+        return path
+
+    return _make
+
+
+@pytest.fixture
+def spy_logger(monkeypatch):
+    """Replace the tools.common logger with a lightweight spy."""
+    spy = SimpleNamespace(warning=Mock(), error=Mock(), log=Mock())
+    monkeypatch.setattr(common, "logger", spy)
+    return spy
+
+
 class TestValidateAndExpandPath:
     """Test path validation and expansion with security checks."""
 
-    def test_valid_absolute_path(self, tmp_path):
+    def test_valid_absolute_path(self, java_project):
         """Test validation with valid absolute path."""
-        test_file = tmp_path / "test.java"
-        test_file.write_text("test content")
+        test_file = java_project / "test.java"
 
         result = validate_and_expand_path(
             str(test_file),
-            project_root=str(tmp_path),
+            project_root=str(java_project),
             must_exist=True
         )
 
         assert result == test_file
         assert result.exists()
 
-    def test_valid_relative_path(self, tmp_path):
+    def test_valid_relative_path(self, java_project):
         """Test validation with valid relative path."""
-        test_file = tmp_path / "src" / "Controller.java"
-        test_file.parent.mkdir(parents=True)
-        test_file.write_text("test content")
-
         result = validate_and_expand_path(
             "src/Controller.java",
-            project_root=str(tmp_path),
+            project_root=str(java_project),
             must_exist=True
         )
 
         assert result.exists()
         assert result.name == "Controller.java"
 
-    def test_file_not_found_must_exist(self, tmp_path):
+    def test_file_not_found_must_exist(self, java_project):
         """Test that missing file raises error when must_exist=True."""
         with pytest.raises(SDKAgentError) as exc_info:
             validate_and_expand_path(
                 "nonexistent.java",
-                project_root=str(tmp_path),
+                project_root=str(java_project),
                 must_exist=True
             )
 
@@ -64,57 +97,53 @@ class TestValidateAndExpandPath:
         assert "[FileNotFoundError]" in str(exc_info.value)
         assert "File does not exist" in str(exc_info.value)
 
-    def test_file_not_found_optional(self, tmp_path):
+    def test_file_not_found_optional(self, java_project):
         """Test that missing file is allowed when must_exist=False."""
         result = validate_and_expand_path(
             "nonexistent.java",
-            project_root=str(tmp_path),
+            project_root=str(java_project),
             must_exist=False
         )
 
         # Should not raise error, just return the path
         assert isinstance(result, Path)
 
-    def test_path_traversal_security(self, tmp_path):
+    def test_path_traversal_security(self, tmp_path, make_file, spy_logger):
         """Test security check for path traversal attempts."""
         # Create file outside project root
-        outside_dir = tmp_path.parent / "outside"
-        outside_dir.mkdir(exist_ok=True)
-        outside_file = outside_dir / "malicious.java"
-        outside_file.write_text("malicious content")
+        outside_file = make_file("outside/malicious.java", "malicious content")
 
         # Try to access file outside project root
-        with patch('sdk_agent.tools.common.logger') as mock_logger:
-            result = validate_and_expand_path(
-                str(outside_file),
-                project_root=str(tmp_path),
-                must_exist=True
-            )
+        result = validate_and_expand_path(
+            str(outside_file),
+            project_root=str(tmp_path / "project"),
+            must_exist=True
+        )
 
-            # Should log warning about path outside project root
-            mock_logger.warning.assert_called_once()
-            warning_message = mock_logger.warning.call_args[0][0]
-            # New standardized error format
-            assert "[SecurityWarning]" in warning_message
-            assert "outside project root" in warning_message
+        # Should log warning about path outside project root
+        spy_logger.warning.assert_called_once()
+        warning_message = spy_logger.warning.call_args[0][0]
+        # New standardized error format
+        assert "[SecurityWarning]" in warning_message
+        assert "outside project root" in warning_message
 
 
-    def test_home_directory_expansion(self, tmp_path):
+    def test_home_directory_expansion(self, tmp_path, make_file, monkeypatch):
         """Test that ~ is expanded correctly."""
-        with patch('pathlib.Path.home') as mock_home:
-            mock_home.return_value = tmp_path
+        # Path.home() reads HOME on POSIX and USERPROFILE on Windows
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("USERPROFILE", str(tmp_path))
 
-            # Create test file in "home" directory
-            test_file = tmp_path / "test.java"
-            test_file.write_text("test")
+        # Create test file in "home" directory
+        make_file("test.java", "test")
 
-            result = validate_and_expand_path(
-                "~/test.java",
-                project_root=str(tmp_path),
-                must_exist=True
-            )
+        result = validate_and_expand_path(
+            "~/test.java",
+            project_root=str(tmp_path),
+            must_exist=True
+        )
 
-            assert result.exists()
+        assert result.exists()
 
 
 class TestValidateToolArgs:
@@ -184,12 +213,20 @@ class TestValidateToolArgs:
         assert "output_format" in error_message
 
 
-class TestFormatAnalysisSummary:
-    """Test analysis result formatting."""
+def _assert_all_in(haystack, needles):
+    """Assert every needle occurs in haystack, in the given order."""
+    idx = 0
+    for needle in needles:
+        pos = haystack.find(needle, idx)
+        assert pos != -1, needle
+        idx = pos + len(needle)
+
 
-    def test_controller_summary(self):
-        """Test formatting of controller analysis."""
-        analysis = {
+# (file_type, analysis, always expected in output order, expected only with include_details)
+SUMMARY_CASES = [
+    pytest.param(
+        "controller",
+        {
             "class_name": "UserController",
             "package": "com.example.controllers",
             "base_url": "/users",
@@ -198,104 +235,79 @@ class TestFormatAnalysisSummary:
                 {"name": "saveUser", "http_method": "POST", "url": "/users/save"}
             ],
             "dependencies": ["UserService", "UserRepository"]
-        }
-
-        summary = format_analysis_summary(analysis, "controller", include_details=True)
-
-        assert "UserController" in summary
-        assert "com.example.controllers" in summary
-        assert "/users" in summary
-        assert "2" in summary  # 2 methods
-        assert "2" in summary  # 2 dependencies
-        assert "GET /users/list" in summary
-        assert "POST /users/save" in summary
-
-    def test_service_summary(self):
-        """Test formatting of service analysis."""
-        analysis = {
+        },
+        ["UserController", "com.example.controllers", "/users", "Methods: 2", "Dependencies: 2"],
+        ["GET /users/list", "POST /users/save", "listUsers"],
+        id="controller",
+    ),
+    pytest.param(
+        "service",
+        {
             "class_name": "UserService",
             "package": "com.example.services",
             "methods": ["findById", "save", "delete"],
             "transactional_methods": ["save", "delete"]
-        }
-
-        summary = format_analysis_summary(analysis, "service", include_details=True)
-
-        assert "UserService" in summary
-        assert "com.example.services" in summary
-        assert "3" in summary  # 3 methods
-        assert "2" in summary  # 2 transactional
-        assert "save" in summary
-        assert "delete" in summary
-
-    def test_jsp_summary(self):
-        """Test formatting of JSP analysis."""
-        analysis = {
+        },
+        ["UserService", "com.example.services", "Methods: 3", "Transactional: 2"],
+        ["save", "delete"],
+        id="service",
+    ),
+    pytest.param(
+        "jsp",
+        {
             "file_name": "user-list.jsp",
             "includes": ["header.jsp", "footer.jsp"],
             "forms": [{"action": "/users/save", "method": "POST"}],
             "ajax_calls": [{"url": "/api/users", "method": "GET"}]
-        }
-
-        summary = format_analysis_summary(analysis, "jsp", include_details=True)
-
-        assert "user-list.jsp" in summary
-        assert "2" in summary  # 2 includes
-        assert "1" in summary  # 1 form
-        assert "1" in summary  # 1 AJAX call
-
-    def test_mapper_summary(self):
-        """Test formatting of mapper analysis."""
-        analysis = {
+        },
+        ["user-list.jsp", "Includes: 2", "Forms: 1", "AJAX Calls: 1"],
+        ["header.jsp", "footer.jsp"],
+        id="jsp",
+    ),
+    pytest.param(
+        "mapper",
+        {
             "namespace": "com.example.mapper.UserMapper",
             "statements": [
                 {"id": "selectAll", "type": "select"},
                 {"id": "insert", "type": "insert"}
             ],
             "result_maps": ["UserResultMap"]
-        }
-
-        summary = format_analysis_summary(analysis, "mapper", include_details=True)
-
-        assert "com.example.mapper.UserMapper" in summary
-        assert "2" in summary  # 2 statements
-        assert "1" in summary  # 1 result map
-
-    def test_procedure_summary(self):
-        """Test formatting of procedure analysis."""
-        analysis = {
+        },
+        ["com.example.mapper.UserMapper", "Statements: 2", "Result Maps: 1"],
+        ["select: selectAll"],
+        id="mapper",
+    ),
+    pytest.param(
+        "procedure",
+        {
             "procedure_name": "sp_update_user",
             "parameters": [
                 {"name": "p_user_id", "type": "NUMBER", "mode": "IN"},
                 {"name": "p_result", "type": "NUMBER", "mode": "OUT"}
             ],
             "calls": ["sp_validate_user"]
-        }
-
-        summary = format_analysis_summary(analysis, "procedure", include_details=True)
+        },
+        ["sp_update_user", "Parameters: 2", "Calls: 1"],
+        ["IN p_user_id NUMBER"],
+        id="procedure",
+    ),
+]
 
-        assert "sp_update_user" in summary
-        assert "2" in summary  # 2 parameters
-        assert "1" in summary  # 1 call
 
-    def test_summary_without_details(self):
-        """Test summary without detailed information."""
-        analysis = {
-            "class_name": "UserController",
-            "package": "com.example",
-            "base_url": "/users",
-            "methods": [{"name": "listUsers"}] * 10,  # 10 methods
-            "dependencies": []
-        }
+class TestFormatAnalysisSummary:
+    """Test analysis result formatting."""
 
-        summary = format_analysis_summary(analysis, "controller", include_details=False)
+    @pytest.mark.parametrize("include_details", [True, False], ids=["details", "no_details"])
+    @pytest.mark.parametrize("file_type,analysis,expected,detail_expected", SUMMARY_CASES)
+    def test_summary(self, file_type, analysis, expected, detail_expected, include_details):
+        """Test summary content for each file type, with and without details."""
+        summary = format_analysis_summary(analysis, file_type, include_details=include_details)
 
-        # Should contain high-level info
-        assert "UserController" in summary
-        assert "10" in summary
+        _assert_all_in(summary, expected)
 
-        # Should NOT contain method details
-        assert "listUsers" not in summary
+        for text in detail_expected:
+            assert (text in summary) is include_details, text
 
 
 class TestHandleAnalysisError:
@@ -333,9 +345,10 @@ class TestHandleAnalysisError:
         assert "not found" in message
         assert "Suggestions:" in message
 
-    @patch('sdk_agent.tools.common.log_structured_error')
-    def test_error_logging(self, mock_log_structured_error):
+    def test_error_logging(self, monkeypatch, spy_logger):
         """Test that errors are logged correctly using structured logging."""
+        mock_log_structured_error = Mock()
+        monkeypatch.setattr(common, "log_structured_error", mock_log_structured_error)
         error = RuntimeError("Analysis failed")
         file_path = "test.java"
         tool_name = "analyze_controller"
@@ -346,7 +359,8 @@ class TestHandleAnalysisError:
         mock_log_structured_error.assert_called_once()
         call_args = mock_log_structured_error.call_args
 
-        # Check that error, component, and context are passed
+        # Check that logger, error, component, and context are passed
+        assert call_args[0][0] is spy_logger
         assert call_args[0][1] == error  # error is second arg (after logger)
         assert call_args[1]["component"] == "analyze_controller"
         assert call_args[1]["context"]["file_path"] == "test.java"
@@ -355,34 +369,31 @@ class TestHandleAnalysisError:
 class TestPathSecurityChecks:
     """Test security checks for path manipulation."""
 
-    def test_prevents_directory_traversal(self, tmp_path):
+    def test_prevents_directory_traversal(self, tmp_path, spy_logger):
         """Test that .. path traversal is caught."""
-        with patch('sdk_agent.tools.common.logger') as mock_logger:
-            # Try to access parent directory
-            validate_and_expand_path(
-                "../../../etc/passwd",
-                project_root=str(tmp_path),
-                must_exist=False
-            )
+        # Try to access parent directory
+        validate_and_expand_path(
+            "../../../etc/passwd",
+            project_root=str(tmp_path),
+            must_exist=False
+        )
 
-            # Should log warning
-            assert mock_logger.warning.called
+        # Should log warning
+        assert spy_logger.warning.called
 
-    def test_absolute_path_outside_project(self, tmp_path):
+    def test_absolute_path_outside_project(self, tmp_path, make_file, spy_logger):
         """Test absolute path outside project root."""
         # Create file outside project
-        outside_file = tmp_path.parent / "outside.java"
-        outside_file.write_text("test")
+        outside_file = make_file("outside.java", "test")
 
-        with patch('sdk_agent.tools.common.logger') as mock_logger:
-            result = validate_and_expand_path(
-                str(outside_file),
-                project_root=str(tmp_path),
-                must_exist=True
-            )
+        result = validate_and_expand_path(
+            str(outside_file),
+            project_root=str(tmp_path / "project"),
+            must_exist=True
+        )
 
-            # Should warn about path outside root
-            mock_logger.warning.assert_called_once()
+        # Should warn about path outside root
+        spy_logger.warning.assert_called_once()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,11 @@
 """Tests for SDK Agent utilities."""
 
 import pytest
-import tempfile
 import os
 from pathlib import Path
+from unittest.mock import Mock, mock_open
 
+from sdk_agent import utils
 from sdk_agent.utils import (
     expand_file_path,
     detect_file_type,
@@ -23,6 +24,72 @@ from sdk_agent.constants import (
 )
 
 
+JAVA_CONTROLLER_BYTES = b"""
+package com.example;
+
+import org.springframework.stereotype.Controller;
+
+@Controller
+public class MyHandler {
+}
+"""
+
+JAVA_SERVICE_BYTES = b"""
+@Service
+public class UserService {
+}
+"""
+
+
+@pytest.fixture
+def java_source(monkeypatch):
+    """
+    Serve Java source to detect_file_type from memory instead of disk.
+
+    Returns:
+        Function that installs the given bytes as the content of any opened file
+    """
+    def _install(data):
+        monkeypatch.setattr(utils, "open", mock_open(read_data=data.decode("utf-8")), raising=False)
+
+    return _install
+
+
+@pytest.fixture(scope="session")
+def sample_tree(tmp_path_factory):
+    """
+    Read-only sample files laid out once per session.
+
+    Returns:
+        Mapping of sample name to its path
+    """
+    root = tmp_path_factory.mktemp("sample_tree")
+    contents = {
+        "jsp": ("view.jsp", b""),
+        "controller_name": ("UserController.java", b"public class UserController {}"),
+        "unknown": ("notes.txt", b""),
+        "prompt": ("prompt.md", b"You are an expert analyzer."),
+    }
+
+    tree = {}
+    for key, (rel, data) in contents.items():
+        path = root / rel
+        path.write_bytes(data)
+        tree[key] = path
+
+    return tree
+
+
+@pytest.fixture(scope="module")
+def java_tree(tmp_path_factory):
+    """Read-only directory with plain and generated Java sources plus a README."""
+    root = tmp_path_factory.mktemp("java_tree")
+    (root / "Test.java").write_text("class Test {}")
+    (root / "TestGenerated.java").write_text("class TestGenerated {}")
+    (root / "README.md").write_text("# Readme")
+    return root
+
+
 class TestExpandFilePath:
     """Test file path expansion."""
 
@@ -32,105 +99,43 @@ class TestExpandFilePath:
         result = expand_file_path(path)
         assert Path(result).is_absolute()
 
-    def test_relative_path_with_root(self):
+    def test_relative_path_with_root(self, tmp_path):
         """Test relative path expansion with project root."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = expand_file_path("src/main/java/Test.java", tmpdir)
-            # Normalize paths for comparison (handles Windows short/long paths)
-            result_normalized = Path(result).resolve()
-            tmpdir_normalized = Path(tmpdir).resolve()
-            assert str(tmpdir_normalized) in str(result_normalized)
-            assert "src" in result and "main" in result and "java" in result and "Test.java" in result
-
-    def test_path_traversal_attack(self):
+        result = expand_file_path("src/main/java/Test.java", str(tmp_path))
+        # expand_file_path resolves its result, so resolve the expected root
+        # too (expands Windows 8.3 short names such as RUNNER~1)
+        assert os.path.normcase(str(tmp_path.resolve())) in os.path.normcase(result)
+        assert "src" in result and "main" in result and "java" in result and "Test.java" in result
+
+    def test_path_traversal_attack(self, tmp_path):
         """Test path traversal prevention."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Try to escape project root
-            malicious_path = "../../../etc/passwd"
+        # Try to escape project root
+        malicious_path = "../../../etc/passwd"
 
-            with pytest.raises(SDKAgentError, match="Security error"):
-                expand_file_path(malicious_path, tmpdir)
+        with pytest.raises(SDKAgentError, match="Security error"):
+            expand_file_path(malicious_path, str(tmp_path))
 
 
 class TestDetectFileType:
     """Test file type detection."""
 
-    def test_jsp_file(self):
-        """Test JSP file detection."""
-        with tempfile.NamedTemporaryFile(
-            suffix=".jsp", delete=False
-        ) as f:
-            file_path = f.name
-
-        try:
-            assert detect_file_type(file_path) == FILE_TYPE_JSP
-        finally:
-            os.unlink(file_path)
-
-    def test_controller_by_name(self):
-        """Test controller detection by filename."""
-        with tempfile.NamedTemporaryFile(
-            suffix="Controller.java", delete=False
-        ) as f:
-            f.write(b"public class UserController {}")
-            file_path = f.name
-
-        try:
-            assert detect_file_type(file_path) == FILE_TYPE_CONTROLLER
-        finally:
-            os.unlink(file_path)
-
-    def test_controller_by_annotation(self):
-        """Test controller detection by @Controller annotation."""
-        java_code = b"""
-package com.example;
-
-import org.springframework.stereotype.Controller;
-
-@Controller
-public class MyHandler {
-}
-"""
-        with tempfile.NamedTemporaryFile(
-            suffix=".java", delete=False
-        ) as f:
-            f.write(java_code)
-            file_path = f.name
-
-        try:
-            assert detect_file_type(file_path) == FILE_TYPE_CONTROLLER
-        finally:
-            os.unlink(file_path)
-
-    def test_service_by_annotation(self):
-        """Test service detection by @Service annotation."""
-        java_code = b"""
-@Service
-public class UserService {
-}
-"""
-        with tempfile.NamedTemporaryFile(
-            suffix=".java", delete=False
-        ) as f:
-            f.write(java_code)
-            file_path = f.name
-
-        try:
-            assert detect_file_type(file_path) == FILE_TYPE_SERVICE
-        finally:
-            os.unlink(file_path)
-
-    def test_unknown_file(self):
-        """Test unknown file type."""
-        with tempfile.NamedTemporaryFile(
-            suffix=".txt", delete=False
-        ) as f:
-            file_path = f.name
-
-        try:
-            assert detect_file_type(file_path) == FILE_TYPE_UNKNOWN
-        finally:
-            os.unlink(file_path)
+    @pytest.mark.parametrize("key,expected", [
+        ("jsp", FILE_TYPE_JSP),
+        ("controller_name", FILE_TYPE_CONTROLLER),
+        ("unknown", FILE_TYPE_UNKNOWN),
+    ])
+    def test_detect_by_path(self, sample_tree, key, expected):
+        """Test detection from file extension and name."""
+        assert detect_file_type(str(sample_tree[key])) == expected
+
+    @pytest.mark.parametrize("file_name,source,expected", [
+        ("MyHandler.java", JAVA_CONTROLLER_BYTES, FILE_TYPE_CONTROLLER),
+        ("UserManager.java", JAVA_SERVICE_BYTES, FILE_TYPE_SERVICE),
+    ], ids=["controller_annotation", "service_annotation"])
+    def test_detect_by_annotation(self, java_source, file_name, source, expected):
+        """Test detection from @Controller / @Service annotations."""
+        java_source(source)
+        assert detect_file_type(file_name) == expected
 
 
 class TestFormatToolResult:
@@ -159,77 +164,55 @@ class TestFormatToolResult:
 class TestValidateConfidence:
     """Test confidence validation."""
 
-    def test_valid_confidence(self):
-        """Test valid confidence scores."""
-        assert validate_confidence(0.8) is True
-        assert validate_confidence(0.7) is True
-        assert validate_confidence(1.0) is True
-
-    def test_invalid_confidence(self):
-        """Test invalid confidence scores."""
-        assert validate_confidence(0.6) is False
-        assert validate_confidence(0.5) is False
-        assert validate_confidence(0.0) is False
-
-    def test_custom_threshold(self):
-        """Test custom threshold."""
-        assert validate_confidence(0.6, min_threshold=0.5) is True
-        assert validate_confidence(0.4, min_threshold=0.5) is False
+    @pytest.mark.parametrize("confidence,threshold,expected", [
+        # Default threshold
+        (0.8, None, True),
+        (0.7, None, True),
+        (1.0, None, True),
+        (0.6, None, False),
+        (0.5, None, False),
+        (0.0, None, False),
+        # Custom threshold
+        (0.6, 0.5, True),
+        (0.4, 0.5, False),
+    ])
+    def test_validate_confidence(self, confidence, threshold, expected):
+        """Test confidence scores against default and custom thresholds."""
+        if threshold is None:
+            assert validate_confidence(confidence) is expected
+        else:
+            assert validate_confidence(confidence, min_threshold=threshold) is expected
 
 
 class TestLoadSystemPrompt:
     """Test system prompt loading."""
 
-    def test_load_prompt(self):
+    def test_load_prompt(self, sample_tree):
         """Test loading system prompt."""
-        prompt_content = "You are an expert analyzer."
+        result = load_system_prompt(str(sample_tree["prompt"]))
+        assert result == "You are an expert analyzer."
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".md", delete=False
-        ) as f:
-            f.write(prompt_content)
-            prompt_path = f.name
+    def test_cached_prompt_skips_disk(self, sample_tree, monkeypatch):
+        """Test a warm cache returns the prompt without reopening the file."""
+        prompt_path = str(sample_tree["prompt"])
+        expected = load_system_prompt(prompt_path)
 
-        try:
-            result = load_system_prompt(prompt_path)
-            assert result == prompt_content
+        mock_open = Mock()
+        monkeypatch.setattr(utils, "open", mock_open, raising=False)
 
-            # Test caching - load again
-            result2 = load_system_prompt(prompt_path)
-            assert result2 == prompt_content
-
-        finally:
-            os.unlink(prompt_path)
+        assert load_system_prompt(prompt_path) == expected
+        assert mock_open.call_count == 0
 
 
 class TestGetFileList:
     """Test file listing."""
 
-    def test_get_java_files(self):
-        """Test getting Java files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create test files
-            Path(tmpdir, "Test1.java").write_text("class Test1 {}")
-            Path(tmpdir, "Test2.java").write_text("class Test2 {}")
-            Path(tmpdir, "README.md").write_text("# Readme")
-
-            files = get_file_list(tmpdir, pattern="**/*.java")
-
-            assert len(files) == 2
-            assert all(f.endswith(".java") for f in files)
-
-    def test_exclude_pattern(self):
-        """Test excluding files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create test files
-            Path(tmpdir, "Test.java").write_text("class Test {}")
-            Path(tmpdir, "TestGenerated.java").write_text("class TestGenerated {}")
-
-            files = get_file_list(
-                tmpdir,
-                pattern="**/*.java",
-                exclude=["*Generated.java"]
-            )
-
-            assert len(files) == 1
-            assert "TestGenerated.java" not in files[0]
+    @pytest.mark.parametrize("exclude,expected", [
+        (None, ["Test.java", "TestGenerated.java"]),
+        (["*Generated.java"], ["Test.java"]),
+    ], ids=["java_files", "exclude_pattern"])
+    def test_get_file_list(self, java_tree, exclude, expected):
+        """Test Java file listing with and without exclusions."""
+        files = get_file_list(str(java_tree), pattern="**/*.java", exclude=exclude)
+
+        assert [Path(f).name for f in files] == expected
@@ -0,0 +1,68 @@
+"""
+Unit tests for the CSR breadth-first traversal kernels.
+"""
+
+from array import array
+
+import pytest
+
+from graph import _bfs
+from graph._bfs import bfs_reachable
+
+
+# 0 -> 1 -> 2 -> 3
+INDPTR = array("q", [0, 1, 2, 3, 3])
+INDICES = array("q", [1, 2, 3])
+
+
+@pytest.fixture
+def kernel_calls(monkeypatch):
+    """Route bfs_reachable through a stubbed compiled kernel, recording its args."""
+    calls = []
+
+    def fake_kernel(indptr, indices, start, max_depth):
+        calls.append(max_depth)
+        return array("q", [1, 2, 3])
+
+    monkeypatch.setattr(_bfs, "numba", object())
+    monkeypatch.setattr(_bfs, "_bfs_kernel", fake_kernel, raising=False)
+    monkeypatch.setattr(_bfs, "_as_ndarray", lambda values: values)
+    return calls
+
+
+@pytest.fixture
+def python_path(monkeypatch):
+    """Force the pure-Python traversal."""
+    monkeypatch.setattr(_bfs, "numba", None)
+
+
+class TestBfsReachable:
+    """Test max_depth handling on both traversal paths."""
+
+    @pytest.mark.parametrize("max_depth, expected", [(None, -1), (0, 0), (2, 2)])
+    def test_kernel_unlimited_sentinel_only_for_none(self, kernel_calls, max_depth, expected):
+        """Test the kernel's -1 sentinel is passed only when max_depth is None."""
+        bfs_reachable(INDPTR, INDICES, 0, max_depth)
+
+        assert kernel_calls == [expected]
+
+    def test_kernel_rejects_negative_depth(self, kernel_calls):
+        """Test negative depths raise before reaching the kernel."""
+        with pytest.raises(ValueError, match="non-negative"):
+            bfs_reachable(INDPTR, INDICES, 0, -1)
+
+        assert kernel_calls == []
+
+    def test_python_rejects_negative_depth(self, python_path):
+        """Test negative depths raise on the pure-Python path too."""
+        with pytest.raises(ValueError, match="non-negative"):
+            bfs_reachable(INDPTR, INDICES, 0, -1)
+
+    @pytest.mark.parametrize("max_depth, expected", [
+        (None, [1, 2, 3]),
+        (0, []),
+        (2, [1, 2]),
+    ])
+    def test_python_depth_limit(self, python_path, max_depth, expected):
+        """Test the pure-Python path honours max_depth."""
+        assert bfs_reachable(INDPTR, INDICES, 0, max_depth) == expected
@@ -2,15 +2,44 @@
 Unit tests for GraphBuilder.
 """
 
+import copy
+
 import pytest
 import tempfile
 from pathlib import Path
 import json
 
+from graph import graph_builder
 from graph.graph_builder import GraphBuilder
 from graph.schema import Node, Edge, NodeType, EdgeType
 
 
+@pytest.fixture(scope="module")
+def canonical_graph():
+    """Controller -> Service -> Mapper -> Table chain shared by read-only query tests."""
+    builder = GraphBuilder()
+
+    builder.add_node(Node(id="controller", type=NodeType.CONTROLLER, name="C"))
+    builder.add_node(Node(id="service", type=NodeType.SERVICE, name="S"))
+    builder.add_node(Node(id="mapper", type=NodeType.MAPPER, name="M"))
+    builder.add_node(Node(id="table", type=NodeType.DATABASE_TABLE, name="T"))
+
+    builder.add_edge(Edge("controller", "service", EdgeType.CALLS_SERVICE))
+    builder.add_edge(Edge("service", "mapper", EdgeType.USES_MAPPER))
+    builder.add_edge(Edge("mapper", "table", EdgeType.QUERIES_TABLE))
+
+    return builder
+
+
+@pytest.fixture
+def controller_service_builder():
+    """Fresh builder holding an unconnected controller and service node."""
+    builder = GraphBuilder()
+    builder.add_node(Node(id="controller", type=NodeType.CONTROLLER, name="C"))
+    builder.add_node(Node(id="service", type=NodeType.SERVICE, name="S"))
+    return builder
+
+
 class TestGraphBuilderInit:
     """Test GraphBuilder initialization."""
 
@@ -77,15 +106,9 @@ class TestAddNode:
 class TestAddEdge:
     """Test adding edges to the graph."""
 
-    def test_add_valid_edge(self):
+    def test_add_valid_edge(self, controller_service_builder):
         """Test adding a valid edge."""
-        builder = GraphBuilder()
-
-        # Add nodes first
-        controller = Node(id="controller", type=NodeType.CONTROLLER, name="C")
-        service = Node(id="service", type=NodeType.SERVICE, name="S")
-        builder.add_node(controller)
-        builder.add_node(service)
+        builder = controller_service_builder
 
         # Add edge
         edge = Edge(
@@ -150,14 +173,9 @@ class TestAddEdge:
         result = builder.add_edge(edge)
         assert result is False  # Should be rejected
 
-    def test_add_duplicate_edge(self):
+    def test_add_duplicate_edge(self, controller_service_builder):
         """Test that adding duplicate edge returns False."""
-        builder = GraphBuilder()
-
-        controller = Node(id="controller", type=NodeType.CONTROLLER, name="C")
-        service = Node(id="service", type=NodeType.SERVICE, name="S")
-        builder.add_node(controller)
-        builder.add_node(service)
+        builder = controller_service_builder
 
         edge = Edge(
             source="controller",
@@ -168,14 +186,9 @@ class TestAddEdge:
         assert builder.add_edge(edge) is True
         assert builder.add_edge(edge) is False  # Duplicate
 
-    def test_add_parallel_edges(self):
+    def test_add_parallel_edges(self, controller_service_builder):
         """Test that MultiDiGraph supports parallel edges."""
-        builder = GraphBuilder()
-
-        controller = Node(id="controller", type=NodeType.CONTROLLER, name="C")
-        service = Node(id="service", type=NodeType.SERVICE, name="S")
-        builder.add_node(controller)
-        builder.add_node(service)
+        builder = controller_service_builder
 
         edge1 = Edge(
             source="controller",
@@ -237,24 +250,10 @@ class TestGetNode:
 class TestGraphQueries:
     """Test graph query methods."""
 
-    def setup_method(self):
-        """Set up test graph."""
-        self.builder = GraphBuilder()
-
-        # Create a small graph: Controller -> Service -> Mapper -> Table
-        self.controller = Node(id="controller", type=NodeType.CONTROLLER, name="C")
-        self.service = Node(id="service", type=NodeType.SERVICE, name="S")
-        self.mapper = Node(id="mapper", type=NodeType.MAPPER, name="M")
-        self.table = Node(id="table", type=NodeType.DATABASE_TABLE, name="T")
-
-        self.builder.add_node(self.controller)
-        self.builder.add_node(self.service)
-        self.builder.add_node(self.mapper)
-        self.builder.add_node(self.table)
-
-        self.builder.add_edge(Edge("controller", "service", EdgeType.CALLS_SERVICE))
-        self.builder.add_edge(Edge("service", "mapper", EdgeType.USES_MAPPER))
-        self.builder.add_edge(Edge("mapper", "table", EdgeType.QUERIES_TABLE))
+    @pytest.fixture(autouse=True)
+    def _use_canonical_graph(self, canonical_graph):
+        """Point read-only tests at the shared chain graph."""
+        self.builder = canonical_graph
 
     def test_get_neighbors_outgoing(self):
         """Test getting outgoing neighbors."""
@@ -288,11 +287,14 @@ class TestGraphQueries:
 
     def test_find_shortest_path_no_path(self):
         """Test that finding path returns None when no path exists."""
+        # Mutates the graph, so work on a private copy
+        builder = copy.deepcopy(self.builder)
+
         # Add isolated node
         isolated = Node(id="isolated", type=NodeType.SERVICE, name="I")
-        self.builder.add_node(isolated)
+        builder.add_node(isolated)
 
-        path = self.builder.find_shortest_path("controller", "isolated")
+        path = builder.find_shortest_path("controller", "isolated")
         assert path is None
 
     def test_find_all_dependencies(self):
@@ -303,6 +305,19 @@ class TestGraphQueries:
         dep_ids = {d.id for d in deps}
         assert dep_ids == {"service", "mapper", "table"}
 
+    def test_repeated_dependency_queries_track_graph_changes(self):
+        """Test memoized closures are private copies and refresh after edits."""
+        builder = copy.deepcopy(self.builder)
+
+        builder.find_all_dependencies("controller").clear()
+        assert len(builder.find_all_dependencies("controller")) == 3
+
+        builder.add_node(Node(id="audit", type=NodeType.DATABASE_TABLE, name="A"))
+        builder.add_edge(Edge("mapper", "audit", EdgeType.QUERIES_TABLE))
+
+        dep_ids = {d.id for d in builder.find_all_dependencies("controller")}
+        assert dep_ids == {"service", "mapper", "table", "audit"}
+
     def test_find_all_dependents(self):
         """Test finding all dependents."""
         dependents = self.builder.find_all_dependents("table")
@@ -342,15 +357,10 @@ class TestGraphStats:
         assert stats["total_edges"] == 0
         assert stats["density"] == 0.0
 
-    def test_graph_stats(self):
+    def test_graph_stats(self, controller_service_builder):
         """Test stats for non-empty graph."""
-        builder = GraphBuilder()
+        builder = controller_service_builder
 
-        # Add some nodes and edges
-        controller = Node(id="controller", type=NodeType.CONTROLLER, name="C")
-        service = Node(id="service", type=NodeType.SERVICE, name="S")
-        builder.add_node(controller)
-        builder.add_node(service)
         builder.add_edge(Edge("controller", "service", EdgeType.CALLS_SERVICE))
 
         stats = builder.get_stats()
@@ -388,14 +398,38 @@ class TestGraphPersistence:
             assert "test" in builder2.nodes
             assert builder2.nodes["test"].type == NodeType.SERVICE
 
-    def test_export_dot(self):
-        """Test exporting to DOT format."""
+    def test_loaded_graph_rejects_duplicate_edge(self, controller_service_builder, tmp_path):
+        """Test edges read back from disk still count as existing for add_edge."""
+        edge = Edge("controller", "service", EdgeType.CALLS_SERVICE)
+        controller_service_builder.add_edge(edge)
+
+        output_path = tmp_path / "graph.json"
+        controller_service_builder.save_graph(str(output_path), format="json")
+
         builder = GraphBuilder()
+        builder.load_graph(str(output_path), format="json")
+
+        assert builder.add_edge(edge) is False
+        assert builder.add_edge(Edge("controller", "service", EdgeType.DEPENDS_ON)) is True
+
+    def test_save_json_without_orjson(self, monkeypatch, tmp_path):
+        """Test JSON output falls back to the stdlib encoder when orjson is missing."""
+        builder = GraphBuilder()
+        builder.add_node(Node(id="test", type=NodeType.SERVICE, name="Test"))
+
+        output_path = tmp_path / "graph.json"
+        builder.save_graph(str(output_path), format="json")
+        expected = json.loads(output_path.read_text())
+
+        monkeypatch.setattr(graph_builder, "orjson", None)
+        builder.save_graph(str(output_path), format="json")
+
+        assert json.loads(output_path.read_text()) == expected
+
+    def test_export_dot(self, controller_service_builder):
+        """Test exporting to DOT format."""
+        builder = controller_service_builder
 
-        controller = Node(id="controller", type=NodeType.CONTROLLER, name="C")
-        service = Node(id="service", type=NodeType.SERVICE, name="S")
-        builder.add_node(controller)
-        builder.add_node(service)
         builder.add_edge(Edge("controller", "service", EdgeType.CALLS_SERVICE))
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -411,14 +445,10 @@ class TestGraphPersistence:
             assert "controller" in content
             assert "service" in content
 
-    def test_export_d3_json(self):
+    def test_export_d3_json(self, controller_service_builder):
         """Test exporting to D3.js JSON format."""
-        builder = GraphBuilder()
+        builder = controller_service_builder
 
-        controller = Node(id="controller", type=NodeType.CONTROLLER, name="C")
-        service = Node(id="service", type=NodeType.SERVICE, name="S")
-        builder.add_node(controller)
-        builder.add_node(service)
         builder.add_edge(Edge("controller", "service", EdgeType.CALLS_SERVICE))
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -548,3 +578,11 @@ class TestIsCustomModel:
         assert builder._is_custom_model("com.example.User")
         assert builder._is_custom_model("com.example.dto.UserDTO")
         assert builder._is_custom_model("UserModel")
+
+    def test_repeated_lookups_hit_cache(self):
+        """Test that repeated classifications are served from the cache."""
+        builder = GraphBuilder()
+
+        assert builder._is_custom_model("com.example.User")
+        assert builder._is_custom_model("com.example.User")
+        assert builder._is_custom_model.cache_info().hits > 0
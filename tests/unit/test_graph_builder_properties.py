@@ -0,0 +1,120 @@
+"""
+Property-based tests for GraphBuilder.build_from_analysis_results.
+
+Generates analysis payloads of varying size and fan-out (up to 1000
+dependencies per controller) so accidental quadratic behaviour shows up
+as a deadline failure instead of a slow production build.
+"""
+
+import pytest
+
+hypothesis = pytest.importorskip(
+    "hypothesis",
+    reason="hypothesis not installed. Install with: pip install hypothesis"
+)
+
+from hypothesis import HealthCheck, given, settings, strategies as st
+
+from graph.graph_builder import GraphBuilder
+from graph.schema import EdgeType
+
+
+IDENTIFIERS = st.from_regex(r"[A-Z][a-z]{0,7}", fullmatch=True)
+
+
+@st.composite
+def analysis_results(draw, max_services=50, max_controllers=50, max_dependencies=1000):
+    """
+    Strategy for Controller -> Service -> Mapper -> Table analysis payloads.
+
+    Args:
+        draw: Hypothesis draw function
+        max_services: Upper bound on service/mapper pairs
+        max_controllers: Upper bound on controllers
+        max_dependencies: Upper bound on dependencies per controller
+
+    Returns:
+        Dictionary in the build_from_analysis_results input format
+    """
+    names = draw(st.lists(IDENTIFIERS, min_size=1, max_size=max_services, unique=True))
+    results = {}
+
+    for name in names:
+        results[f"mapper/{name}Mapper.xml"] = {
+            "agent": "mapper",
+            "analysis": {
+                "namespace": f"com.example.{name}Mapper",
+                "tables_accessed": [name.upper()],
+            },
+            "confidence": 0.9,
+        }
+        results[f"service/{name}Service.java"] = {
+            "agent": "service",
+            "analysis": {
+                "class_name": f"{name}Service",
+                "package": "com.example",
+                "dependencies": [
+                    {"type": f"{name}Mapper", "field_name": "mapper", "purpose": "repository"}
+                ],
+            },
+            "confidence": 0.9,
+        }
+
+    n_controllers = draw(st.integers(min_value=0, max_value=max_controllers))
+    for i in range(n_controllers):
+        # Fan-out is drawn, targets cycle through the services (with repeats)
+        fanout = draw(st.integers(min_value=0, max_value=max_dependencies))
+        results[f"controller/Controller{i}.java"] = {
+            "agent": "controller",
+            "analysis": {
+                "class_name": f"Controller{i}",
+                "package": "com.example",
+                "dependencies": [
+                    {"type": f"{names[(i + k) % len(names)]}Service", "field_name": f"dep{k}"}
+                    for k in range(fanout)
+                ],
+            },
+            "confidence": 0.9,
+        }
+
+    return results
+
+
+class TestBuildProperties:
+    """Invariants of build_from_analysis_results over generated payloads."""
+
+    @given(payload=analysis_results())
+    @settings(max_examples=20, deadline=2000, suppress_health_check=[HealthCheck.too_slow])
+    def test_build_scales(self, payload):
+        """Test builds stay within the deadline and never add more nodes than results."""
+        builder = GraphBuilder()
+
+        nodes_added, edges_added = builder.build_from_analysis_results(payload)
+
+        assert nodes_added <= len(payload)
+        assert edges_added == builder.graph.number_of_edges()
+
+    @given(payload=analysis_results(max_services=10, max_controllers=10, max_dependencies=50))
+    @settings(max_examples=20, deadline=2000)
+    def test_edges_follow_schema(self, payload):
+        """Test every edge produced by a build is a valid schema pattern."""
+        builder = GraphBuilder()
+        builder.build_from_analysis_results(payload)
+
+        for source, target, edge_type in builder.graph.edges(data="type"):
+            assert builder.schema.validate_edge(
+                builder.nodes[source].type,
+                EdgeType(edge_type),
+                builder.nodes[target].type
+            )
+
+    @given(payload=analysis_results(max_services=10, max_controllers=10, max_dependencies=50))
+    @settings(max_examples=20, deadline=2000)
+    def test_rebuild_is_idempotent(self, payload):
+        """Test building the same payload twice adds nothing the second time."""
+        builder = GraphBuilder()
+        builder.build_from_analysis_results(payload)
+        stats = (builder.graph.number_of_nodes(), builder.graph.number_of_edges())
+
+        assert builder.build_from_analysis_results(payload) == (0, 0)
+        assert (builder.graph.number_of_nodes(), builder.graph.number_of_edges()) == stats
@@ -95,6 +95,14 @@ class TestNode:
         node_set = {node1, node2, node3}
         assert len(node_set) == 2  # node1 and node3 are same (same ID)
 
+    def test_node_is_immutable_and_slotted(self):
+        """Test that nodes are frozen and carry no per-instance __dict__."""
+        node = Node(id="test.A", type=NodeType.SERVICE, name="A")
+
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.name = "B"
+
 
 class TestEdge:
     """Test Edge dataclass."""
@@ -261,3 +269,31 @@ class TestGraphSchema:
             EdgeType.USES_MAPPER
         )
         assert NodeType.MAPPER in targets
+
+    def test_validate_edge_matches_valid_patterns(self):
+        """Test the precomputed masks agree with VALID_PATTERNS for every triple."""
+        for source in NodeType:
+            for edge_type in EdgeType:
+                for target in NodeType:
+                    expected = (source, edge_type, target) in GraphSchema.VALID_PATTERNS
+                    assert GraphSchema.validate_edge(source, edge_type, target) is expected
+
+    @pytest.mark.parametrize("source, edge_type, target", [
+        ("controller", EdgeType.CALLS_SERVICE, NodeType.SERVICE),
+        (NodeType.CONTROLLER, "calls_service", NodeType.SERVICE),
+        (NodeType.CONTROLLER, EdgeType.CALLS_SERVICE, None),
+    ])
+    def test_non_enum_input_is_rejected(self, source, edge_type, target):
+        """Test raw strings and None are invalid rather than raising."""
+        assert GraphSchema().validate_edge(source, edge_type, target) is False
+        assert GraphSchema.validate_edge(source, edge_type, target) is False
+
+    @pytest.mark.parametrize("source, edge_type", [
+        ("controller", EdgeType.CALLS_SERVICE),
+        (NodeType.CONTROLLER, "calls_service"),
+        (None, None),
+    ])
+    def test_non_enum_input_has_no_targets(self, source, edge_type):
+        """Test raw strings and None have no allowed targets rather than raising."""
+        assert GraphSchema.get_allowed_targets(source, edge_type) == []
+
@@ -0,0 +1,293 @@
+"""
+Unit tests for JavaValidator.
+"""
+
+import pytest
+
+pytest.importorskip("javalang", reason="javalang not installed")
+
+from validators import java_validator
+from validators.java_validator import JavaAnalysis, JavaValidator, ValidationResult, is_controller
+
+
+CONTROLLER_SOURCE = """
+package com.example.web;
+
+import org.springframework.stereotype.Controller;
+
+@Controller
+public class UserController {
+    public String list() {
+        return "users/list";
+    }
+}
+"""
+
+BROKEN_SOURCE = """
+package com.example;
+
+public class Broken {
+    public void run( {
+    }
+}
+"""
+
+
+@pytest.fixture
+def validator():
+    """Fresh validator with an empty parse cache."""
+    return JavaValidator()
+
+
+@pytest.fixture
+def parse_calls(validator, monkeypatch):
+    """Count calls into javalang's parser for the given validator."""
+    calls = []
+    real_parse = validator.javalang.parse.parse
+
+    def counting_parse(code):
+        calls.append(code)
+        return real_parse(code)
+
+    monkeypatch.setattr(validator.javalang.parse, "parse", counting_parse)
+    return calls
+
+
+class TestValidateSyntax:
+    """Test syntax validation."""
+
+    def test_valid_source(self, validator):
+        """Test well-formed source validates."""
+        result = validator.validate_syntax(CONTROLLER_SOURCE)
+
+        assert result == ValidationResult(
+            valid=True,
+            error=None,
+            error_line=None,
+            validator_available=True
+        )
+
+    def test_syntax_error(self, validator):
+        """Test malformed source reports an error."""
+        result = validator.validate_syntax(BROKEN_SOURCE)
+
+        assert result.valid is False
+        assert result.validator_available is True
+
+
+class TestPrecheck:
+    """Test sources that cannot parse are rejected before javalang runs."""
+
+    @pytest.mark.parametrize("code", [
+        "Some release notes, not Java.",
+        "class Open { void run() { }",
+        "class Extra { } }",
+    ])
+    def test_rejected_without_parse(self, validator, parse_calls, code):
+        """Test prose and unbalanced braces fail without invoking the parser."""
+        result = validator.validate_syntax(code)
+
+        assert result.valid is False
+        assert parse_calls == []
+
+    @pytest.mark.parametrize("code", [
+        'class Braces { String open = "{"; char close = \'}\'; /* { */ }  // {',
+        "package com.example;",
+    ])
+    def test_valid_sources_still_parse(self, validator, parse_calls, code):
+        """Test braces in literals/comments and type-less units reach the parser."""
+        assert validator.validate_syntax(code).valid is True
+        assert len(parse_calls) == 1
+
+
+class TestValidateMany:
+    """Test batch validation."""
+
+    def test_matches_validate_syntax(self, validator):
+        """Test pooled results line up with one-at-a-time validation."""
+        codes = [CONTROLLER_SOURCE, BROKEN_SOURCE, "class A {}", CONTROLLER_SOURCE]
+
+        results = validator.validate_many(codes, max_workers=2)
+
+        assert results == [JavaValidator().validate_syntax(code) for code in codes]
+
+    def test_serial_reuses_cache(self, validator, parse_calls):
+        """Test cached and duplicate sources are not parsed again."""
+        validator.validate_syntax(CONTROLLER_SOURCE)
+
+        results = validator.validate_many(
+            [CONTROLLER_SOURCE, "class A {}", "class A {}"], max_workers=1
+        )
+
+        assert [result.valid for result in results] == [True, True, True]
+        assert parse_calls == [CONTROLLER_SOURCE, "class A {}"]
+
+
+class TestExtraction:
+    """Test class name and package extraction."""
+
+    def test_extract_class_name(self, validator):
+        """Test the first class declaration is returned."""
+        assert validator.extract_class_name(CONTROLLER_SOURCE) == "UserController"
+
+    def test_extract_class_name_skips_to_first_class(self, validator):
+        """Test a leading interface is skipped and classes nested in it still count."""
+        assert validator.extract_class_name(
+            "interface Api {}\nenum Kind { A }\nclass Impl implements Api {}"
+        ) == "Impl"
+        assert validator.extract_class_name(
+            "interface Api { class Default implements Api {} }\nclass Impl {}"
+        ) == "Default"
+
+    def test_extract_package(self, validator):
+        """Test the package declaration is returned."""
+        assert validator.extract_package(CONTROLLER_SOURCE) == "com.example.web"
+
+    def test_extract_from_broken_source(self, validator):
+        """Test extraction returns None when source does not parse."""
+        assert validator.extract_class_name(BROKEN_SOURCE) is None
+        assert validator.extract_package(BROKEN_SOURCE) is None
+
+
+class TestLexOnlyExtraction:
+    """Test header extraction without a full parse."""
+
+    def test_matches_full_parse(self, validator, parse_calls):
+        """Test the token scan agrees with the parser and never calls it."""
+        assert validator.extract_class_name(CONTROLLER_SOURCE, full_parse=False) == "UserController"
+        assert validator.extract_package(CONTROLLER_SOURCE, full_parse=False) == "com.example.web"
+        assert parse_calls == []
+
+    def test_skips_class_literals(self, validator):
+        """Test Foo.class in an annotation is not mistaken for a declaration."""
+        code = "package a.b;\n@RunWith(Foo.class)\npublic final class FooTest {}"
+
+        assert validator.extract_class_name(code, full_parse=False) == "FooTest"
+
+    def test_body_is_not_checked(self, validator):
+        """Test errors after the header do not affect the token scan."""
+        assert validator.extract_class_name(BROKEN_SOURCE, full_parse=False) == "Broken"
+        assert validator.extract_package(BROKEN_SOURCE, full_parse=False) == "com.example"
+
+
+class TestAnalyze:
+    """Test the combined single-parse analysis."""
+
+    def test_analyze_controller(self, validator, parse_calls):
+        """Test all fields come from one parse and match the single-purpose helpers."""
+        result = validator.analyze(CONTROLLER_SOURCE)
+
+        assert result == JavaAnalysis(
+            valid=True,
+            error=None,
+            error_line=None,
+            class_name="UserController",
+            package="com.example.web",
+            is_controller=True,
+            validator_available=True
+        )
+        assert len(parse_calls) == 1
+
+    def test_analyze_broken_source(self, validator):
+        """Test a syntax error matches validate_syntax and clears extracted fields."""
+        result = validator.analyze(BROKEN_SOURCE)
+        expected = validator.validate_syntax(BROKEN_SOURCE)
+
+        assert result.valid is False
+        assert result.error == expected.error
+        assert result.error_line == expected.error_line
+        assert result.class_name is None
+        assert result.package is None
+
+
+class TestParseCache:
+    """Test parse results are shared between validator calls."""
+
+    def test_same_source_parsed_once(self, validator, parse_calls):
+        """Test validate + extract on one source parses it a single time."""
+        validator.validate_syntax(CONTROLLER_SOURCE)
+        validator.extract_class_name(CONTROLLER_SOURCE)
+        validator.extract_package(CONTROLLER_SOURCE)
+
+        assert len(parse_calls) == 1
+
+    def test_syntax_errors_are_cached(self, validator, parse_calls):
+        """Test a failing source is not re-parsed and reports the same error."""
+        first = validator.validate_syntax(BROKEN_SOURCE)
+        second = validator.validate_syntax(BROKEN_SOURCE)
+
+        assert first == second
+        assert len(parse_calls) == 1
+
+    def test_cache_is_bounded(self, validator, parse_calls, monkeypatch):
+        """Test least recently used sources are evicted past the size limit."""
+        monkeypatch.setattr(java_validator, "PARSE_CACHE_SIZE", 2)
+        sources = [f"class C{i} {{}}" for i in range(3)]
+
+        for code in sources:
+            validator.validate_syntax(code)
+        validator.validate_syntax(sources[0])
+
+        assert len(parse_calls) == 4
+
+
+class TestDiskCache:
+    """Test parse results persist across validator instances."""
+
+    def test_warm_cache_skips_parse(self, tmp_path, monkeypatch):
+        """Test a second validator on the same cache file does not re-parse."""
+        cache_path = str(tmp_path / "ast_cache.db")
+        first = JavaValidator(cache_path=cache_path)
+        assert first.extract_class_name(CONTROLLER_SOURCE) == "UserController"
+        first.close()
+
+        second = JavaValidator(cache_path=cache_path)
+        calls = []
+        monkeypatch.setattr(second.javalang.parse, "parse", calls.append)
+
+        assert second.extract_class_name(CONTROLLER_SOURCE) == "UserController"
+        assert second.extract_package(CONTROLLER_SOURCE) == "com.example.web"
+        assert calls == []
+        second.close()
+
+    def test_syntax_errors_persist(self, tmp_path):
+        """Test a cached failure reports the same result as a fresh parse."""
+        cache_path = str(tmp_path / "ast_cache.db")
+        fresh = JavaValidator(cache_path=cache_path).validate_syntax(BROKEN_SOURCE)
+
+        warm = JavaValidator(cache_path=cache_path)
+        assert warm.validate_syntax(BROKEN_SOURCE) == fresh
+        warm.close()
+
+    def test_large_sources_not_stored(self, tmp_path, monkeypatch):
+        """Test sources past the size limit bypass the disk cache."""
+        monkeypatch.setattr(java_validator, "DISK_CACHE_MAX_BYTES", 8)
+        validator = JavaValidator(cache_path=str(tmp_path / "ast_cache.db"))
+        validator.validate_syntax(CONTROLLER_SOURCE)
+
+        rows = validator._disk_cache.execute("SELECT COUNT(*) FROM ast_cache").fetchone()
+        assert rows == (0,)
+        validator.close()
+
+
+class TestIsController:
+    """Test the controller annotation heuristic."""
+
+    @pytest.mark.parametrize("code, expected", [
+        (CONTROLLER_SOURCE, True),
+        ("@RestController\npublic class Api {}", True),
+        ("@Service\npublic class UserService {}", False),
+        ("public class ControllerUtils {}", False),
+    ])
+    def test_is_controller(self, validator, code, expected):
+        """Test @Controller and @RestController are detected."""
+        assert is_controller(code) is expected
+        assert validator.is_controller(code) is expected
+
+    def test_does_not_import_javalang(self):
+        """Test construction and is_controller leave the parser unloaded."""
+        validator = JavaValidator()
+
+        assert validator.is_controller(CONTROLLER_SOURCE)
+        assert "javalang" not in vars(validator)
+        assert "available" not in vars(validator)
@@ -5,8 +5,16 @@ These validators ensure syntax correctness and basic structural validity
 without re-implementing full parsing logic.
 """
 
-from validators.java_validator import JavaValidator
+from validators.java_validator import (
+    JavaAnalysis,
+    JavaValidator,
+    ValidationResult,
+    is_controller,
+)
 
 __all__ = [
+    "JavaAnalysis",
     "JavaValidator",
+    "ValidationResult",
+    "is_controller",
 ]
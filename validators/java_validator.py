@@ -5,8 +5,104 @@ This module provides minimal syntax validation for Java code.
 It does NOT perform semantic analysis - just checks if code is parseable.
 """
 
-from typing import Dict, Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import functools
+import hashlib
 import logging
+import os
+import pickle
+import re
+import sqlite3
+
+
+# Number of distinct sources whose parse results are kept per validator
+PARSE_CACHE_SIZE = 256
+
+# Sources larger than this are never written to the on-disk cache
+DISK_CACHE_MAX_BYTES = 512 * 1024
+
+# Bump when the layout of stored rows changes
+_DISK_CACHE_VERSION = b"1"
+
+# String/char literals and comments, delimited the way javalang's lexer
+# reads them (literals may span lines), so braces inside them can be
+# discarded before counting
+_LITERALS_AND_COMMENTS_RE = re.compile(
+    r'"(?:\\.|[^"\\])*"'
+    r"|'(?:\\.|[^'\\])*'"
+    r"|//[^\n]*"
+    r"|/\*.*?\*/",
+    re.DOTALL
+)
+
+# Matches the same prefixes as the old substring checks (so
+# @ControllerAdvice still counts), but in a single pass over the source
+_CONTROLLER_ANNOTATION_RE = re.compile(r"@(?:Rest)?Controller")
+
+
+def is_controller(code: str) -> bool:
+    """
+    Quick check if code appears to be a Spring Controller.
+
+    Looks for @Controller or @RestController annotations.
+    This is a heuristic check, not exhaustive, and needs no parser, so it
+    can be used without constructing a JavaValidator.
+
+    Args:
+        code: Java source code
+
+    Returns:
+        True if appears to be a controller, False otherwise
+    """
+    return _CONTROLLER_ANNOTATION_RE.search(code) is not None
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationResult:
+    """
+    Outcome of JavaValidator.validate_syntax.
+
+    Attributes:
+        valid: Whether the source parsed (True when javalang is unavailable)
+        error: Error message if parsing failed
+        error_line: Line of the syntax error, if known
+        validator_available: Whether javalang was available to check
+    """
+    valid: bool
+    error: Optional[str]
+    error_line: Optional[int]
+    validator_available: bool
+
+
+# Shared results for the common success paths (instances are immutable)
+_VALID = ValidationResult(valid=True, error=None, error_line=None, validator_available=True)
+_VALID_UNCHECKED = ValidationResult(valid=True, error=None, error_line=None, validator_available=False)
+
+
+@dataclass(frozen=True, slots=True)
+class JavaAnalysis:
+    """
+    Everything JavaValidator can tell about a source file from one parse.
+
+    Attributes:
+        valid: Whether the source parsed (True when javalang is unavailable)
+        error: Error message if parsing failed
+        error_line: Line of the syntax error, if known
+        class_name: First class declaration, if any
+        package: Package declaration, if any
+        is_controller: Whether a controller annotation is present
+        validator_available: Whether javalang was available to check
+    """
+    valid: bool
+    error: Optional[str]
+    error_line: Optional[int]
+    class_name: Optional[str]
+    package: Optional[str]
+    is_controller: bool
+    validator_available: bool
 
 
 class JavaValidator:
@@ -20,23 +116,251 @@ class JavaValidator:
     not a replacement for LLM analysis.
     """
 
-    def __init__(self):
-        """Initialize the Java validator."""
+    def __init__(self, cache_path: Optional[str] = None):
+        """
+        Initialize the Java validator.
+
+        Args:
+            cache_path: Optional SQLite file for persisting parse results
+                across runs. Disabled when None.
+        """
         self.logger = logging.getLogger("validators.java_validator")
 
-        # Import javalang with lazy loading
+        # Parse results keyed by source digest: (tree, None) or (None, error)
+        self._parse_cache: "OrderedDict[bytes, Tuple[Any, Optional[Exception]]]" = OrderedDict()
+
+        self._cache_path = cache_path
+        self._disk_cache: Optional[sqlite3.Connection] = None
+        self._disk_salt = b""
+        if cache_path and self.available:
+            self._open_disk_cache(cache_path)
+
+    @functools.cached_property
+    def javalang(self) -> Any:
+        """
+        The javalang module, imported on first use.
+
+        Deferred so validators that only call is_controller never pay for
+        loading the parser.
+
+        Returns:
+            The javalang module, or None if it is not installed
+        """
         try:
             import javalang
-            self.javalang = javalang
-            self.available = True
         except ImportError:
             self.logger.warning(
                 "javalang not installed - Java validation disabled. "
                 "Install with: pip install javalang"
             )
-            self.available = False
+            return None
+        return javalang
+
+    @functools.cached_property
+    def available(self) -> bool:
+        """Whether javalang can be imported (checked on first access)."""
+        return self.javalang is not None
 
-    def validate_syntax(self, code: str) -> Dict[str, Any]:
+    def _open_disk_cache(self, cache_path: str) -> None:
+        """
+        Open (creating if needed) the persistent parse cache.
+
+        Rows are keyed by a digest that also covers the javalang version,
+        so upgrading the parser never serves stale trees. Failure to open
+        the database only disables the disk layer.
+
+        Args:
+            cache_path: Path to the SQLite database file
+        """
+        try:
+            conn = sqlite3.connect(cache_path, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ast_cache ("
+                "hash BLOB PRIMARY KEY, tree BLOB, err BLOB, lineno INT)"
+            )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Java parse cache disabled ({cache_path}): {e}")
+            return
+
+        version = getattr(self.javalang, "__version__", "")
+        self._disk_salt = _DISK_CACHE_VERSION + b"\0" + str(version).encode() + b"\0"
+        self._disk_cache = conn
+
+    @staticmethod
+    def _memory_key(code: str) -> bytes:
+        """Digest keying the in-memory parse cache."""
+        return hashlib.blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def _is_cached(self, code: str) -> bool:
+        """Whether a parse result for code is available without parsing."""
+        if self._memory_key(code) in self._parse_cache:
+            return True
+
+        key = self._disk_key(code)
+        if key is None:
+            return False
+        try:
+            row = self._disk_cache.execute(
+                "SELECT 1 FROM ast_cache WHERE hash = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return False
+        return row is not None
+
+    def _parse(self, code: str) -> Tuple[Any, Optional[Exception]]:
+        """
+        Parse Java source, reusing the result for previously seen source.
+
+        Validating and then extracting the class and package of the same
+        file would otherwise parse it three times. Failures are cached too,
+        so callers get the original exception back instead of a re-parse.
+        When a cache_path was given, misses fall through to the on-disk cache
+        before parsing.
+
+        Args:
+            code: Java source code as string
+
+        Returns:
+            Tuple of (compilation unit, None) on success or (None, exception)
+        """
+        key = self._memory_key(code)
+
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            self._parse_cache.move_to_end(key)
+            return cached
+
+        result = self._load_from_disk(code)
+        if result is None:
+            error = self._precheck(code)
+            if error is not None:
+                result = (None, error)
+            else:
+                try:
+                    result = (self.javalang.parse.parse(code), None)
+                except Exception as e:
+                    # Drop the traceback so cached errors don't pin parser frames
+                    result = (None, e.with_traceback(None))
+            self._store_on_disk(code, result)
+
+        self._parse_cache[key] = result
+        if len(self._parse_cache) > PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+
+        return result
+
+    def _precheck(self, code: str) -> Optional[Exception]:
+        """
+        Reject sources the parser is certain to fail on, without parsing.
+
+        javalang tokenizes the whole input before parsing, so prose or
+        another language pays a full lex (~100ms per 100KB) just to fail on
+        the first token, and unbalanced braces are only noticed at the end
+        of a full parse. Both checks are conservative: anything they let
+        through is decided by the parser as before.
+
+        Args:
+            code: Java source code as string
+
+        Returns:
+            JavaSyntaxError if the source cannot parse, None if undecided
+        """
+        tokenizer = self.javalang.tokenizer
+        syntax_error = self.javalang.parser.JavaSyntaxError
+
+        # A compilation unit can only open with an annotation, package,
+        # import, modifier, type keyword or empty declaration
+        try:
+            first = next(tokenizer.tokenize(code), None)
+        except tokenizer.LexerError:
+            return None
+        if first is not None and not (
+            isinstance(first, (tokenizer.Annotation, tokenizer.Modifier))
+            or first.value in ("package", "import", "class", "interface", "enum", ";")
+        ):
+            return syntax_error("Unexpected token at start of input", at=first)
+
+        # Unicode escapes can encode braces and are expanded by the lexer,
+        # so the raw text is only trustworthy without them
+        if "\\u" not in code:
+            stripped = _LITERALS_AND_COMMENTS_RE.sub("", code)
+            if stripped.count("{") != stripped.count("}"):
+                return syntax_error("Unbalanced braces")
+
+        return None
+
+    def _disk_key(self, code: str) -> Optional[bytes]:
+        """Digest for the on-disk cache, or None if code should not be stored."""
+        if self._disk_cache is None:
+            return None
+        data = code.encode("utf-8", "surrogatepass")
+        if len(data) > DISK_CACHE_MAX_BYTES:
+            return None
+        return hashlib.sha256(self._disk_salt + data).digest()
+
+    def _load_from_disk(self, code: str) -> Optional[Tuple[Any, Optional[Exception]]]:
+        """
+        Look up a persisted parse result.
+
+        Args:
+            code: Java source code as string
+
+        Returns:
+            Cached (tree, error) tuple, or None on a miss or unreadable row
+        """
+        key = self._disk_key(code)
+        if key is None:
+            return None
+
+        try:
+            row = self._disk_cache.execute(
+                "SELECT tree, err FROM ast_cache WHERE hash = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            tree, err = row
+            if err is not None:
+                return (None, pickle.loads(err))
+            return (pickle.loads(tree), None)
+        except Exception as e:
+            self.logger.debug(f"Discarding unreadable parse cache entry: {e}")
+            return None
+
+    def _store_on_disk(self, code: str, result: Tuple[Any, Optional[Exception]]) -> None:
+        """
+        Persist a parse result; errors here never fail validation.
+
+        Args:
+            code: Java source code as string
+            result: (tree, error) tuple returned by the parser
+        """
+        key = self._disk_key(code)
+        if key is None:
+            return
+
+        tree, error = result
+        try:
+            if error is None:
+                row = (key, pickle.dumps(tree, protocol=5), None, None)
+            else:
+                row = (key, None, pickle.dumps(error, protocol=5),
+                       getattr(error, "lineno", None))
+            self._disk_cache.execute(
+                "INSERT OR REPLACE INTO ast_cache (hash, tree, err, lineno) "
+                "VALUES (?, ?, ?, ?)",
+                row
+            )
+        except Exception as e:
+            self.logger.debug(f"Could not persist parse result: {e}")
+
+    def close(self) -> None:
+        """Close the on-disk parse cache, if one is open."""
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+
+    def validate_syntax(self, code: str) -> ValidationResult:
         """
         Check if Java code is syntactically valid.
 
@@ -44,62 +368,230 @@ class JavaValidator:
             code: Java source code as string
 
         Returns:
-            Dictionary with validation result:
-            {
-                "valid": bool,
-                "error": str or None,
-                "error_line": int or None,
-                "validator_available": bool
-            }
+            ValidationResult; successful checks share a single instance
         """
         if not self.available:
-            # Validator not available - pass through
-            return {
-                "valid": True,  # Assume valid if we can't check
-                "error": None,
-                "error_line": None,
-                "validator_available": False
-            }
+            # Validator not available - pass through (assume valid)
+            return _VALID_UNCHECKED
+
+        # Attempt to parse the Java code
+        _, error = self._parse(code)
+
+        if error is None:
+            return _VALID
+
+        error_msg, error_line = self._describe_error(error)
+        return ValidationResult(
+            valid=False,
+            error=error_msg,
+            error_line=error_line,
+            validator_available=True
+        )
+
+    def validate_many(
+        self,
+        codes: List[str],
+        max_workers: Optional[int] = None
+    ) -> List[ValidationResult]:
+        """
+        Validate a batch of sources, parsing uncached ones in parallel.
 
-        try:
-            # Attempt to parse the Java code
-            self.javalang.parse.parse(code)
+        javalang is pure Python, so parsing is spread over worker
+        processes. Sources already in this validator's memory or disk cache
+        are answered in-process; duplicates are parsed once. Workers share
+        the on-disk cache when one is configured, so their results are
+        reused by later runs (but are not added to this validator's
+        in-memory cache).
+
+        Args:
+            codes: Java sources to validate
+            max_workers: Worker process limit (defaults to the CPU count);
+                1 validates serially in this process
+
+        Returns:
+            One ValidationResult per source, in input order
+        """
+        if not self.available:
+            return [_VALID_UNCHECKED] * len(codes)
+
+        results: List[Optional[ValidationResult]] = [None] * len(codes)
+        pending: Dict[str, List[int]] = {}
+
+        for index, code in enumerate(codes):
+            if self._is_cached(code):
+                results[index] = self.validate_syntax(code)
+            else:
+                pending.setdefault(code, []).append(index)
+
+        workers = min(max_workers or os.cpu_count() or 1, len(pending))
+
+        if workers <= 1:
+            for code, indices in pending.items():
+                result = self.validate_syntax(code)
+                for index in indices:
+                    results[index] = result
+            return results
+
+        chunksize = max(1, len(pending) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self._cache_path,)
+        ) as executor:
+            outcomes = executor.map(_validate_in_worker, pending, chunksize=chunksize)
+            for indices, result in zip(pending.values(), outcomes):
+                for index in indices:
+                    results[index] = result
+
+        return results
+
+    def _describe_error(self, error: Exception) -> Tuple[str, Optional[int]]:
+        """
+        Turn a parse failure into a message and line number.
 
-            return {
-                "valid": True,
-                "error": None,
-                "error_line": None,
-                "validator_available": True
-            }
+        Args:
+            error: Exception raised by javalang
 
-        except self.javalang.parser.JavaSyntaxError as e:
+        Returns:
+            Tuple of (error message, line number or None)
+        """
+        if isinstance(error, self.javalang.parser.JavaSyntaxError):
             # Syntax error found
-            error_line = getattr(e, 'lineno', None)
-            error_msg = str(e)
+            error_line = getattr(error, 'lineno', None)
+            error_msg = str(error)
 
             self.logger.debug(
                 f"Java syntax error at line {error_line}: {error_msg}"
             )
+            return error_msg, error_line
 
-            return {
-                "valid": False,
-                "error": error_msg,
-                "error_line": error_line,
-                "validator_available": True
-            }
+        # Unexpected error during parsing
+        self.logger.warning(f"Unexpected error during Java validation: {error}")
+        return f"Validation error: {str(error)}", None
 
-        except Exception as e:
-            # Unexpected error during parsing
-            self.logger.warning(f"Unexpected error during Java validation: {e}")
+    def analyze(self, code: str) -> JavaAnalysis:
+        """
+        Validate and extract class, package and controller flag in one call.
+
+        Prefer this over calling validate_syntax, extract_class_name,
+        extract_package and is_controller separately on the same source.
+
+        Args:
+            code: Java source code as string
+
+        Returns:
+            JavaAnalysis for the source
+        """
+        is_controller = self.is_controller(code)
+
+        if not self.available:
+            return JavaAnalysis(
+                valid=True,
+                error=None,
+                error_line=None,
+                class_name=None,
+                package=None,
+                is_controller=is_controller,
+                validator_available=False
+            )
 
-            return {
-                "valid": False,
-                "error": f"Validation error: {str(e)}",
-                "error_line": None,
-                "validator_available": True
-            }
+        tree, error = self._parse(code)
+
+        if error is not None:
+            error_msg, error_line = self._describe_error(error)
+            return JavaAnalysis(
+                valid=False,
+                error=error_msg,
+                error_line=error_line,
+                class_name=None,
+                package=None,
+                is_controller=is_controller,
+                validator_available=True
+            )
+
+        return JavaAnalysis(
+            valid=True,
+            error=None,
+            error_line=None,
+            class_name=self._first_class_name(tree),
+            package=tree.package.name if tree.package else None,
+            is_controller=is_controller,
+            validator_available=True
+        )
+
+    def _first_class_name(self, tree: Any) -> Optional[str]:
+        """
+        Name of the first class declaration in a compilation unit.
+
+        Args:
+            tree: Parsed javalang compilation unit
+
+        Returns:
+            Class name if found, None otherwise
+        """
+        class_declaration = self.javalang.tree.ClassDeclaration
+
+        # Top-level types first: the package and imports never contain a
+        # class, so this only falls back to walking a type's subtree when
+        # it is an interface/enum/annotation that may nest one, which keeps
+        # the result identical to a full pre-order walk of the tree
+        for type_declaration in tree.types:
+            if isinstance(type_declaration, class_declaration):
+                return type_declaration.name
+            for _, node in type_declaration:
+                if isinstance(node, class_declaration):
+                    return node.name
+
+        return None
+
+    def _lex_header(self, code: str, want_class: bool) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Pull the package and first class name from the token stream.
+
+        The tokenizer is a generator, so scanning stops at the first type
+        declaration (or first class, when want_class) without lexing the
+        rest of the file or building an AST.
+
+        Args:
+            code: Java source code
+            want_class: Keep scanning past interfaces/enums for a class
+
+        Returns:
+            Tuple of (package name, class name); either may be None
+        """
+        tokenizer = self.javalang.tokenizer
+        package = None
+        package_parts = None
+        previous = None
 
-    def extract_class_name(self, code: str) -> Optional[str]:
+        try:
+            tokens = tokenizer.tokenize(code)
+            for token in tokens:
+                if package_parts is not None:
+                    if token.value == ";":
+                        package = "".join(package_parts)
+                        package_parts = None
+                    else:
+                        package_parts.append(token.value)
+                elif isinstance(token, tokenizer.Keyword):
+                    if token.value == "package" and package is None:
+                        package_parts = []
+                    elif token.value == "class" and (previous is None or previous.value != "."):
+                        # Not a class literal such as @RunWith(Foo.class)
+                        name = next(tokens, None)
+                        if isinstance(name, tokenizer.Identifier):
+                            return package, name.value
+                        return package, None
+                    elif token.value in ("interface", "enum") and not want_class:
+                        return package, None
+                previous = token
+        except tokenizer.LexerError as e:
+            self.logger.debug(f"Could not tokenize Java source: {e}")
+            return None, None
+
+        return package, None
+
+    def extract_class_name(self, code: str, full_parse: bool = True) -> Optional[str]:
         """
         Quick extraction of class name (validation helper).
 
@@ -108,6 +600,9 @@ class JavaValidator:
 
         Args:
             code: Java source code
+            full_parse: Parse the whole file, returning None if it does not
+                parse. When False, only the tokens up to the first class
+                are scanned and the rest of the file is not checked.
 
         Returns:
             Class name if found, None otherwise
@@ -115,26 +610,25 @@ class JavaValidator:
         if not self.available:
             return None
 
-        try:
-            tree = self.javalang.parse.parse(code)
-
-            # Find first class declaration
-            for path, node in tree:
-                if isinstance(node, self.javalang.tree.ClassDeclaration):
-                    return node.name
+        if not full_parse:
+            return self._lex_header(code, want_class=True)[1]
 
+        tree, error = self._parse(code)
+        if error is not None:
+            self.logger.debug(f"Could not extract class name: {error}")
             return None
 
-        except Exception as e:
-            self.logger.debug(f"Could not extract class name: {e}")
-            return None
+        return self._first_class_name(tree)
 
-    def extract_package(self, code: str) -> Optional[str]:
+    def extract_package(self, code: str, full_parse: bool = True) -> Optional[str]:
         """
         Quick extraction of package name.
 
         Args:
             code: Java source code
+            full_parse: Parse the whole file, returning None if it does not
+                parse. When False, only the tokens up to the first type
+                declaration are scanned and the rest is not checked.
 
         Returns:
             Package name if found, None otherwise
@@ -142,24 +636,25 @@ class JavaValidator:
         if not self.available:
             return None
 
-        try:
-            tree = self.javalang.parse.parse(code)
-
-            if tree.package:
-                return tree.package.name
+        if not full_parse:
+            return self._lex_header(code, want_class=False)[0]
 
+        tree, error = self._parse(code)
+        if error is not None:
+            self.logger.debug(f"Could not extract package: {error}")
             return None
 
-        except Exception as e:
-            self.logger.debug(f"Could not extract package: {e}")
-            return None
+        if tree.package:
+            return tree.package.name
+
+        return None
 
-    def is_controller(self, code: str) -> bool:
+    @staticmethod
+    def is_controller(code: str) -> bool:
         """
         Quick check if code appears to be a Spring Controller.
 
-        Looks for @Controller or @RestController annotations.
-        This is a heuristic check, not exhaustive.
+        Same as the module-level is_controller, kept for existing callers.
 
         Args:
             code: Java source code
@@ -167,15 +662,24 @@ class JavaValidator:
         Returns:
             True if appears to be a controller, False otherwise
         """
-        # Simple string check (fast)
-        controller_indicators = [
-            "@Controller",
-            "@RestController"
-        ]
-
-        return any(indicator in code for indicator in controller_indicators)
+        return is_controller(code)
 
     def __repr__(self) -> str:
         """Return string representation for debugging."""
         status = "available" if self.available else "unavailable"
         return f"<JavaValidator(status={status})>"
+
+
+# Per-process validator for validate_many workers
+_worker_validator: Optional[JavaValidator] = None
+
+
+def _init_worker(cache_path: Optional[str]) -> None:
+    """Create the worker's validator once, so javalang loads once per process."""
+    global _worker_validator
+    _worker_validator = JavaValidator(cache_path=cache_path)
+
+
+def _validate_in_worker(code: str) -> ValidationResult:
+    """Validate one source in a validate_many worker process."""
+    return _worker_validator.validate_syntax(code)
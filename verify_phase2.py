@@ -5,26 +5,108 @@ Verification script for Phase 2: Infrastructure.
 Verifies that all Phase 2 components are correctly set up.
 """
 
+import os
+import stat
+import subprocess
 import sys
-from pathlib import Path
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# (module, names, label on success, label on failure)
+IMPORT_CHECKS = [
+    ("sdk_agent", "SpringMVCAnalyzerAgent", "sdk_agent.SpringMVCAnalyzerAgent", "SpringMVCAnalyzerAgent"),
+    ("sdk_agent.config", "load_config, SDKAgentConfig", "sdk_agent.config", "config"),
+    ("sdk_agent.exceptions", "SDKAgentError, ConfigurationError", "sdk_agent.exceptions", "exceptions"),
+    ("sdk_agent.utils", "detect_file_type, format_tool_result", "sdk_agent.utils", "utils"),
+    ("sdk_agent.permissions", "PermissionManager", "sdk_agent.permissions", "permissions"),
+]
+
+@lru_cache(maxsize=None)
+def list_directory(dir_path: str) -> Optional[Dict[str, bool]]:
+    """List a directory once as {name: is_dir}, or None if it can't be read."""
+    try:
+        with os.scandir(dir_path or ".") as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
+    except OSError:
+        return None
+
+def path_status(path: str) -> Tuple[bool, bool]:
+    """Return (exists, is_dir) using the cached listing of the parent directory."""
+    parent, name = os.path.split(path)
+    entries = list_directory(parent)
+    if entries is None:
+        # Unlistable parent: one stat answers both questions
+        try:
+            return True, stat.S_ISDIR(os.stat(path).st_mode)
+        except OSError:
+            return False, False
+    if name not in entries:
+        return False, False
+    return True, entries[name]
 
 def check_file_exists(file_path: str) -> Tuple[bool, str]:
     """Check if file exists."""
-    path = Path(file_path)
-    if path.exists():
+    exists, _ = path_status(file_path)
+    if exists:
         return True, f"✅ {file_path}"
     else:
         return False, f"❌ {file_path} - NOT FOUND"
 
 def check_directory_exists(dir_path: str) -> Tuple[bool, str]:
     """Check if directory exists."""
-    path = Path(dir_path)
-    if path.exists() and path.is_dir():
+    exists, is_dir = path_status(dir_path)
+    if exists and is_dir:
         return True, f"✅ {dir_path}/"
     else:
         return False, f"❌ {dir_path}/ - NOT FOUND"
 
+def run_import_checks() -> Tuple[List[Optional[str]], List[Tuple[int, str]]]:
+    """
+    Run IMPORT_CHECKS in one fresh interpreter with -X importtime.
+
+    Returns:
+        Tuple of (per-check error message or None, five slowest imports
+        as (self time in us, module))
+    """
+    lines = []
+    for index, (module, names, _, _) in enumerate(IMPORT_CHECKS):
+        lines += [
+            "try:",
+            f"    from {module} import {names}",
+            f"    print({index}, '')",
+            "except ImportError as e:",
+            f"    print({index}, str(e).replace(chr(10), ' ') or repr(e))",
+        ]
+
+    try:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "\n".join(lines)],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except OSError as e:
+        return [f"could not start interpreter: {e}"] * len(IMPORT_CHECKS), []
+
+    errors: List[Optional[str]] = [
+        f"check did not run (exit code {result.returncode})"
+    ] * len(IMPORT_CHECKS)
+    for line in result.stdout.splitlines():
+        index, _, message = line.partition(" ")
+        if index.isdigit() and int(index) < len(IMPORT_CHECKS):
+            errors[int(index)] = message or None
+
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) == 3 and fields[0].strip().isdigit():
+            timings.append((int(fields[0]), fields[2].strip()))
+    timings.sort(reverse=True)
+
+    return errors, timings[:5]
+
 def verify_phase2() -> int:
     """
     Verify Phase 2 infrastructure.
@@ -110,45 +192,24 @@ def verify_phase2() -> int:
 
     # Try importing SDK agent modules
     print("📦 Checking imports...")
-    try:
-        from sdk_agent import SpringMVCAnalyzerAgent
-        print("   ✅ sdk_agent.SpringMVCAnalyzerAgent")
-    except ImportError as e:
-        print(f"   ❌ Failed to import SpringMVCAnalyzerAgent: {e}")
-        all_passed = False
-
-    try:
-        from sdk_agent.config import load_config, SDKAgentConfig
-        print("   ✅ sdk_agent.config")
-    except ImportError as e:
-        print(f"   ❌ Failed to import config: {e}")
-        all_passed = False
-
-    try:
-        from sdk_agent.exceptions import SDKAgentError, ConfigurationError
-        print("   ✅ sdk_agent.exceptions")
-    except ImportError as e:
-        print(f"   ❌ Failed to import exceptions: {e}")
-        all_passed = False
+    import_errors, slowest_imports = run_import_checks()
+    for (_, _, label, name), error in zip(IMPORT_CHECKS, import_errors):
+        if error is None:
+            print(f"   ✅ {label}")
+        else:
+            print(f"   ❌ Failed to import {name}: {error}")
+            all_passed = False
 
-    try:
-        from sdk_agent.utils import detect_file_type, format_tool_result
-        print("   ✅ sdk_agent.utils")
-    except ImportError as e:
-        print(f"   ❌ Failed to import utils: {e}")
-        all_passed = False
-
-    try:
-        from sdk_agent.permissions import PermissionManager
-        print("   ✅ sdk_agent.permissions")
-    except ImportError as e:
-        print(f"   ❌ Failed to import permissions: {e}")
-        all_passed = False
+    if slowest_imports:
+        print("   Slowest imports (self time):")
+        for self_us, module in slowest_imports:
+            print(f"      {self_us / 1000:7.1f} ms  {module}")
 
     print()
 
     # Try loading configuration
     print("🔧 Checking configuration loading...")
+    config = None
     try:
         from sdk_agent.config import load_config
         config = load_config("config/sdk_agent_config.yaml")
@@ -167,9 +228,13 @@ def verify_phase2() -> int:
     print("🤖 Checking agent creation...")
     try:
         from sdk_agent import SpringMVCAnalyzerAgent
-        agent = SpringMVCAnalyzerAgent(
-            config_path="config/sdk_agent_config.yaml"
-        )
+        # Reuse the config parsed above rather than loading the YAML again
+        if config is not None:
+            agent = SpringMVCAnalyzerAgent(config=config)
+        else:
+            agent = SpringMVCAnalyzerAgent(
+                config_path="config/sdk_agent_config.yaml"
+            )
         print(f"   ✅ Agent created successfully")
         print(f"      System prompt: {len(agent.system_prompt)} chars")
         print(f"      Config mode: {agent.config.mode}")